@@ -1,6 +1,20 @@
 import random
-import copy
+import numpy as np
 from typing import Tuple, List, Optional
+from models import ChessGame, SNAPSHOT_PIECES
+
+# Numba is optional: without it the AI searches with the plain-Python minimax in ChessAI
+try:
+    from numba import njit
+    numba_available = True
+except ImportError:
+    numba_available = False
+
+    def njit(*args, **kwargs):
+        """Fallback for @njit / @njit(...) that leaves the function as-is"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
 
 class ChessAI:
     def __init__(self, depth=3):
@@ -91,7 +105,7 @@ class ChessAI:
     def get_best_move(self, game_copy) -> Optional[Tuple[int, int, int, int]]:
         """
         Get the best move using Minimax with Alpha-Beta pruning
-        Operates on 'game_copy', which is a deep copy of the actual game state.
+        Operates on 'game_copy', a game rebuilt from a snapshot (ChessGame.from_snapshot), never the live game.
         Returns tuple: (from_row, from_col, to_row, to_col)
         """
         # Ensure 'game_copy' is a valid ChessGame object
@@ -99,6 +113,9 @@ class ChessAI:
             print("Error: game_copy object is not a valid ChessGame instance.")
             return None
 
+        if numba_available:
+            return self._get_best_move_jit(game_copy)
+
         # Get all possible moves for current player (black/AI)
         # It's important that get_all_possible_moves also operates on game_copy
         possible_moves = self.get_all_possible_moves(game_copy)
@@ -120,11 +137,7 @@ class ChessAI:
         for move_info in possible_moves:
             from_row, from_col, to_row, to_col, promotion_piece = move_info # Now includes promotion piece
             
-            # Create a temporary state for the move and capture
-            # We will use this to restore the game_copy's state
-            temp_state = self._store_temp_state(game_copy)
-            
-            # Make the move on the game_copy
+            # Make the move on the game_copy (undone with pop() below)
             # Pass promotion_piece if it's a pawn move to the 8th rank
             self._make_move_on_copy(game_copy, from_row, from_col, to_row, to_col, promotion_piece)
             
@@ -134,7 +147,7 @@ class ChessAI:
             move_value = self.minimax(game_copy, self.depth - 1, alpha, beta, True)  # True = maximizing (white's turn next)
             
             # Undo the move to restore game_copy to its state before the loop iteration
-            self._restore_temp_state(game_copy, temp_state)
+            game_copy.pop()
             
             # Since AI is minimizing (Black), we want the move that results in the lowest score
             if move_value < best_value:
@@ -147,6 +160,22 @@ class ChessAI:
                 
         return best_move
 
+    def _get_best_move_jit(self, game_copy) -> Optional[Tuple[int, int, int, int]]:
+        """
+        Runs the search in the compiled kernel: the board is packed into an int8[64]
+        array (SNAPSHOT_PIECES codes, square = row * 8 + col) and the kernel's
+        (from_sq, to_sq) answer is mapped back to board coordinates.
+        """
+        board = np.array([_PIECE_CODES[piece] for row in game_copy.board for piece in row], dtype=np.int8)
+        rights = game_copy.castling_rights
+        castling = ((CASTLE_WK if rights['w']['king_side'] else 0) | (CASTLE_WQ if rights['w']['queen_side'] else 0) |
+                    (CASTLE_BK if rights['b']['king_side'] else 0) | (CASTLE_BQ if rights['b']['queen_side'] else 0))
+        from_sq, to_sq = _search_root(board, game_copy.turn == 'w', castling, game_copy.halfmove_clock,
+                                      self.depth, random.randrange(2 ** 31))
+        if from_sq < 0:
+            return None
+        return (from_sq // 8, from_sq % 8, to_sq // 8, to_sq % 8)
+
     def minimax(self, game_copy, depth: int, alpha: float, beta: float, maximizing_player: bool) -> float:
         """
         Minimax algorithm with alpha-beta pruning
@@ -174,12 +203,11 @@ class ChessAI:
             for move_info in possible_moves:
                 from_row, from_col, to_row, to_col, promotion_piece = move_info
                 
-                temp_state = self._store_temp_state(game_copy) # Store state before making move
                 self._make_move_on_copy(game_copy, from_row, from_col, to_row, to_col, promotion_piece)
                 
                 eval_score = self.minimax(game_copy, depth - 1, alpha, beta, False) # Next is minimizing player
                 
-                self._restore_temp_state(game_copy, temp_state) # Restore state after evaluation
+                game_copy.pop() # Restore state after evaluation
                 
                 max_eval = max(max_eval, eval_score)
                 alpha = max(alpha, eval_score)
@@ -194,12 +222,11 @@ class ChessAI:
             for move_info in possible_moves:
                 from_row, from_col, to_row, to_col, promotion_piece = move_info
                 
-                temp_state = self._store_temp_state(game_copy) # Store state before making move
                 self._make_move_on_copy(game_copy, from_row, from_col, to_row, to_col, promotion_piece)
                 
                 eval_score = self.minimax(game_copy, depth - 1, alpha, beta, True) # Next is maximizing player
                 
-                self._restore_temp_state(game_copy, temp_state) # Restore state after evaluation
+                game_copy.pop() # Restore state after evaluation
                 
                 min_eval = min(min_eval, eval_score)
                 beta = min(beta, eval_score)
@@ -256,117 +283,14 @@ class ChessAI:
 
         return moves
 
-    def _store_temp_state(self, game_copy):
-        """
-        Stores necessary parts of the game_copy's state before a temporary move.
-        This is a more robust way than just returning the captured piece.
-        """
-        return {
-            'board': copy.deepcopy(game_copy.board), # Deep copy the board
-            'turn': game_copy.turn,
-            'en_passant_target': game_copy.en_passant_target,
-            'castling_rights': copy.deepcopy(game_copy.castling_rights),
-            'halfmove_clock': game_copy.halfmove_clock,
-            'fullmove_number': game_copy.fullmove_number,
-            'last_move': game_copy.last_move if hasattr(game_copy, 'last_move') else None # Store last_move if it exists
-        }
-
-    def _restore_temp_state(self, game_copy, temp_state):
-        """
-        Restores the game_copy's state from the stored temporary state.
-        """
-        game_copy.board = temp_state['board']
-        game_copy.turn = temp_state['turn']
-        game_copy.en_passant_target = temp_state['en_passant_target']
-        game_copy.castling_rights = temp_state['castling_rights']
-        game_copy.halfmove_clock = temp_state['halfmove_clock']
-        game_copy.fullmove_number = temp_state['fullmove_number']
-        if hasattr(game_copy, 'last_move'):
-            game_copy.last_move = temp_state['last_move']
-
     def _make_move_on_copy(self, game_copy, from_row: int, from_col: int, to_row: int, to_col: int, promotion_piece: Optional[str]):
         """
-        Makes a move directly on the 'game_copy' board and updates its state.
-        Handles captures, pawn promotion, castling, and en passant.
-        This replaces make_temporary_move and part of undo_temporary_move.
-        This method needs to mirror the logic in your ChessGame.move_piece.
+        Makes a move in place on 'game_copy' with ChessGame.push (undo it with game_copy.pop())
+        and flags checkmate/stalemate for the side to move.
         """
-        piece_moved = game_copy.board[from_row][from_col]
-        if not piece_moved:
-            return # Should not happen if get_all_possible_moves is correct
+        piece_color = game_copy.board[from_row][from_col][0]
 
-        piece_type = piece_moved[1]
-        piece_color = piece_moved[0]
-        
-        # Reset en passant target
-        game_copy.en_passant_target = None
-        
-        # Handle pawn specific moves:
-        # 1. En Passant Capture
-        if piece_type == 'p' and (to_row, to_col) == game_copy.en_passant_target:
-            # Determine captured pawn's position
-            captured_pawn_row = from_row if piece_color == 'b' else to_row + 1 # if black pawn moved down, capture row is one above to_row
-            captured_pawn_col = to_col
-            game_copy.board[captured_pawn_row][captured_pawn_col] = '' # Remove captured pawn
-        
-        # 2. Pawn Promotion
-        if piece_type == 'p' and (to_row == 0 or to_row == 7): # Reached promotion rank
-            # Promote the pawn (promotion_piece should be passed, default to queen)
-            game_copy.board[to_row][to_col] = piece_color + (promotion_piece if promotion_piece else 'q')
-            game_copy.board[from_row][from_col] = ''
-            return # Move handled
-            
-        # 3. Two-square pawn advance (set en passant target)
-        if piece_type == 'p' and abs(from_row - to_row) == 2:
-            game_copy.en_passant_target = (from_row + (1 if piece_color == 'w' else -1), to_col)
-
-        # Handle Castling
-        if piece_type == 'k' and abs(from_col - to_col) == 2: # King moved two squares
-            # Determine if it's kingside or queenside castling
-            if to_col > from_col: # Kingside
-                rook_from_col, rook_to_col = 7, 5
-            else: # Queenside
-                rook_from_col, rook_to_col = 0, 3
-            
-            # Move the rook
-            rook_piece = game_copy.board[from_row][rook_from_col]
-            game_copy.board[from_row][rook_to_col] = rook_piece
-            game_copy.board[from_row][rook_from_col] = ''
-
-        # Normal piece move (including captures)
-        game_copy.board[to_row][to_col] = piece_moved
-        game_copy.board[from_row][from_col] = ''
-
-        # Update castling rights (simple approach)
-        if piece_type == 'k':
-            game_copy.castling_rights[piece_color + 'K'] = False
-            game_copy.castling_rights[piece_color + 'Q'] = False
-        elif piece_type == 'r':
-            if from_col == 0: # Queenside rook
-                game_copy.castling_rights[piece_color + 'Q'] = False
-            elif from_col == 7: # Kingside rook
-                game_copy.castling_rights[piece_color + 'K'] = False
-        # If a rook is captured on its original square, castling rights might also change
-        # This is more complex and depends on how your `move_piece` handles it.
-        # For simplicity, if a piece is moved *to* a rook's starting square, disable that castling.
-        if (to_row, to_col) == (0, 0): game_copy.castling_rights['bQ'] = False
-        if (to_row, to_col) == (0, 7): game_copy.castling_rights['bK'] = False
-        if (to_row, to_col) == (7, 0): game_copy.castling_rights['wQ'] = False
-        if (to_row, to_col) == (7, 7): game_copy.castling_rights['wK'] = False
-
-
-        # Update halfmove clock (for fifty-move rule and draws)
-        if game_copy.board[to_row][to_col] != '' or piece_type == 'p': # Capture or pawn move resets halfmove clock
-            game_copy.halfmove_clock = 0
-        else:
-            game_copy.halfmove_clock += 1
-
-        # Update fullmove number
-        if piece_color == 'b':
-            game_copy.fullmove_number += 1
-
-        # Switch turn
-        game_copy.turn = 'w' if game_copy.turn == 'b' else 'b'
+        game_copy.push((from_row, from_col), (to_row, to_col), promotion_piece)
 
         # Check for game over conditions (checkmate/stalemate) after the move
         # This requires `is_king_in_check` and `get_all_legal_moves` for the *new* turn.
@@ -545,4 +469,351 @@ class ChessAI:
             return safety_score
         except Exception as e:
             # print(f"Error evaluating king safety for {color}: {e}") # Suppress for performance
-            return 0
\ No newline at end of file
+            return 0
+
+
+# --- Compiled search kernel -------------------------------------------------------------------
+# Mirrors ChessAI's evaluation (material, piece-square tables, mobility, king safety) on an
+# int8[64] board. Piece codes are the SNAPSHOT_PIECES indices: 1-6 white p n b r q k, 7-12 black.
+# Move rules follow ChessGame.get_valid_moves, which has no en passant capture (its en passant
+# target is the pawn's landing square, so that "capture" is an ordinary one); the kernel must never
+# suggest a move the game would then refuse.
+_PIECE_CODES = {piece: code for code, piece in enumerate(SNAPSHOT_PIECES)}
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = 1, 2, 3, 4, 5, 6
+CASTLE_WK, CASTLE_WQ, CASTLE_BK, CASTLE_BQ = 1, 2, 4, 8
+MATE_SCORE = 1000000
+_INF = 1 << 30
+_MAX_PLY = 16
+_MAX_MOVES = 256
+
+_KNIGHT_STEPS = np.array([(2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1)], dtype=np.int64)
+_KING_STEPS = np.array([(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, -1), (-1, 1)], dtype=np.int64)
+# Sliding directions: the first four are diagonal (bishop), the last four straight (rook)
+_SLIDE_DIRS = np.array([(1, 1), (1, -1), (-1, -1), (-1, 1), (0, 1), (1, 0), (0, -1), (-1, 0)], dtype=np.int64)
+
+# Castling bits that survive a move touching each square (king or rook home squares clear theirs)
+_CASTLE_KEEP = np.full(64, 15, dtype=np.int64)
+_CASTLE_KEEP[60] = 15 & ~(CASTLE_WK | CASTLE_WQ)
+_CASTLE_KEEP[63] = 15 & ~CASTLE_WK
+_CASTLE_KEEP[56] = 15 & ~CASTLE_WQ
+_CASTLE_KEEP[4] = 15 & ~(CASTLE_BK | CASTLE_BQ)
+_CASTLE_KEEP[7] = 15 & ~CASTLE_BK
+_CASTLE_KEEP[0] = 15 & ~CASTLE_BQ
+
+_PIECE_VALUES = np.array([0, 100, 320, 330, 500, 900, 20000], dtype=np.int64)
+
+
+def _build_square_tables():
+    """Flatten ChessAI's 8x8 tables into one (piece type, square) array plus the endgame king row"""
+    ai = ChessAI()
+    tables = np.zeros((7, 64), dtype=np.int64)
+    for piece_type, table in ((PAWN, ai.pawn_table), (KNIGHT, ai.knight_table), (BISHOP, ai.bishop_table),
+                              (ROOK, ai.rook_table), (QUEEN, ai.queen_table), (KING, ai.king_table)):
+        tables[piece_type] = np.array(table, dtype=np.int64).ravel()
+    return tables, np.array(ai.king_table_endgame, dtype=np.int64).ravel()
+
+
+_SQUARE_TABLES, _KING_ENDGAME_TABLE = _build_square_tables()
+
+
+@njit(cache=True)
+def _is_attacked(board, sq, by_white):
+    """True if a piece of the given side attacks sq (same rules as ChessGame.would_square_be_in_check)"""
+    row, col = sq // 8, sq % 8
+    base = 0 if by_white else 6
+    # Pawns attack toward the far side, so an attacking pawn sits one row behind sq
+    pawn_row = row + 1 if by_white else row - 1
+    if 0 <= pawn_row < 8:
+        for dc in (-1, 1):
+            c = col + dc
+            if 0 <= c < 8 and board[pawn_row * 8 + c] == base + PAWN:
+                return True
+    for i in range(8):
+        r, c = row + _KNIGHT_STEPS[i, 0], col + _KNIGHT_STEPS[i, 1]
+        if 0 <= r < 8 and 0 <= c < 8 and board[r * 8 + c] == base + KNIGHT:
+            return True
+        r, c = row + _KING_STEPS[i, 0], col + _KING_STEPS[i, 1]
+        if 0 <= r < 8 and 0 <= c < 8 and board[r * 8 + c] == base + KING:
+            return True
+    for i in range(8):
+        slider = BISHOP if i < 4 else ROOK
+        dr, dc = _SLIDE_DIRS[i, 0], _SLIDE_DIRS[i, 1]
+        r, c = row + dr, col + dc
+        while 0 <= r < 8 and 0 <= c < 8:
+            piece = board[r * 8 + c]
+            if piece:
+                if piece == base + slider or piece == base + QUEEN:
+                    return True
+                break
+            r += dr
+            c += dc
+    return False
+
+
+@njit(cache=True)
+def _find_king(board, white):
+    king = KING if white else KING + 6
+    for sq in range(64):
+        if board[sq] == king:
+            return sq
+    return -1
+
+
+@njit(cache=True)
+def _make_move(board, frm, to, promo, castling):
+    """
+    Plays frm -> to on board in place (captures, castling rook, promotion).
+    Returns (captured piece, new castling bits).
+    """
+    piece = board[frm]
+    piece_type = piece if piece <= 6 else piece - 6
+    captured = board[to]
+    board[to] = piece
+    board[frm] = 0
+    if piece_type == PAWN:
+        if promo:
+            board[to] = promo if piece <= 6 else promo + 6
+    elif piece_type == KING and abs(to - frm) == 2:
+        if to > frm:
+            board[frm + 1] = board[frm + 3]
+            board[frm + 3] = 0
+        else:
+            board[frm - 1] = board[frm - 4]
+            board[frm - 4] = 0
+    return captured, castling & _CASTLE_KEEP[frm] & _CASTLE_KEEP[to]
+
+
+@njit(cache=True)
+def _unmake_move(board, frm, to, piece, captured):
+    """Undoes _make_move given the moved piece and what it captured"""
+    board[frm] = piece
+    board[to] = captured
+    if (piece == KING or piece == KING + 6) and abs(to - frm) == 2:
+        if to > frm:
+            board[frm + 3] = board[frm + 1]
+            board[frm + 1] = 0
+        else:
+            board[frm - 4] = board[frm - 1]
+            board[frm - 1] = 0
+
+
+@njit(cache=True)
+def _add_if_legal(board, moves, n, frm, to, promo, white, king_sq):
+    """Appends (frm, to, promo) to moves if it does not leave the mover's king attacked"""
+    piece = board[frm]
+    captured, _ = _make_move(board, frm, to, promo, 0)
+    king = to if king_sq == frm else king_sq
+    legal = not _is_attacked(board, king, not white)
+    _unmake_move(board, frm, to, piece, captured)
+    if legal:
+        moves[n, 0] = frm
+        moves[n, 1] = to
+        moves[n, 2] = promo
+        n += 1
+    return n
+
+
+@njit(cache=True)
+def _generate_moves(board, white, castling, moves):
+    """Fills moves with the side's legal (from, to, promotion) moves and returns how many there are"""
+    n = 0
+    own_lo = 1 if white else 7
+    king_sq = _find_king(board, white)
+    for frm in range(64):
+        piece = board[frm]
+        if piece < own_lo or piece > own_lo + 5:
+            continue
+        piece_type = piece - own_lo + 1
+        row, col = frm // 8, frm % 8
+        if piece_type == PAWN:
+            step = -1 if white else 1
+            r = row + step
+            if r < 0 or r > 7:
+                continue
+            last_rank = r == 0 or r == 7
+            if board[r * 8 + col] == 0:
+                if last_rank:
+                    # Only queen promotions: the root returns (from, to) and move_piece always queens
+                    n = _add_if_legal(board, moves, n, frm, r * 8 + col, QUEEN, white, king_sq)
+                else:
+                    n = _add_if_legal(board, moves, n, frm, r * 8 + col, 0, white, king_sq)
+                    start_row = 6 if white else 1
+                    if row == start_row and board[(r + step) * 8 + col] == 0:
+                        n = _add_if_legal(board, moves, n, frm, (r + step) * 8 + col, 0, white, king_sq)
+            for dc in (-1, 1):
+                c = col + dc
+                if c < 0 or c > 7:
+                    continue
+                to = r * 8 + c
+                target = board[to]
+                if target and (target < own_lo or target > own_lo + 5):
+                    if last_rank:
+                        n = _add_if_legal(board, moves, n, frm, to, QUEEN, white, king_sq)
+                    else:
+                        n = _add_if_legal(board, moves, n, frm, to, 0, white, king_sq)
+        elif piece_type == KNIGHT or piece_type == KING:
+            for i in range(8):
+                if piece_type == KNIGHT:
+                    r, c = row + _KNIGHT_STEPS[i, 0], col + _KNIGHT_STEPS[i, 1]
+                else:
+                    r, c = row + _KING_STEPS[i, 0], col + _KING_STEPS[i, 1]
+                if 0 <= r < 8 and 0 <= c < 8:
+                    target = board[r * 8 + c]
+                    if target == 0 or target < own_lo or target > own_lo + 5:
+                        n = _add_if_legal(board, moves, n, frm, r * 8 + c, 0, white, king_sq)
+        else:
+            first = 4 if piece_type == ROOK else 0
+            last = 4 if piece_type == BISHOP else 8
+            for i in range(first, last):
+                dr, dc = _SLIDE_DIRS[i, 0], _SLIDE_DIRS[i, 1]
+                r, c = row + dr, col + dc
+                while 0 <= r < 8 and 0 <= c < 8:
+                    target = board[r * 8 + c]
+                    if target == 0 or target < own_lo or target > own_lo + 5:
+                        n = _add_if_legal(board, moves, n, frm, r * 8 + c, 0, white, king_sq)
+                    if target:
+                        break
+                    r += dr
+                    c += dc
+    # Castling: king and rook unmoved, squares between empty, king not passing through check
+    home = 60 if white else 4
+    rook = ROOK if white else ROOK + 6
+    king_side = CASTLE_WK if white else CASTLE_BK
+    queen_side = CASTLE_WQ if white else CASTLE_BQ
+    if king_sq == home and not _is_attacked(board, home, not white):
+        if (castling & king_side and board[home + 3] == rook and board[home + 1] == 0 and board[home + 2] == 0
+                and not _is_attacked(board, home + 1, not white) and not _is_attacked(board, home + 2, not white)):
+            moves[n, 0] = home
+            moves[n, 1] = home + 2
+            moves[n, 2] = 0
+            n += 1
+        if (castling & queen_side and board[home - 4] == rook and board[home - 1] == 0 and board[home - 2] == 0
+                and board[home - 3] == 0
+                and not _is_attacked(board, home - 1, not white) and not _is_attacked(board, home - 2, not white)):
+            moves[n, 0] = home
+            moves[n, 1] = home - 2
+            moves[n, 2] = 0
+            n += 1
+    return n
+
+
+@njit(cache=True)
+def _king_safety(board, white):
+    """ChessAI.evaluate_king_safety: friendly pieces around the king, minus 100 when in check"""
+    king_sq = _find_king(board, white)
+    if king_sq < 0:
+        return -100000
+    own_lo = 1 if white else 7
+    row, col = king_sq // 8, king_sq % 8
+    score = 0
+    for i in range(8):
+        r, c = row + _KING_STEPS[i, 0], col + _KING_STEPS[i, 1]
+        if 0 <= r < 8 and 0 <= c < 8:
+            piece = board[r * 8 + c]
+            if own_lo <= piece <= own_lo + 5:
+                score += 15 if piece == own_lo else 5
+    if _is_attacked(board, king_sq, not white):
+        score -= 100
+    return score
+
+
+@njit(cache=True)
+def _evaluate(board, white_moves, black_moves):
+    """ChessAI.evaluate_position for a position that is not over; positive favours white"""
+    major_minor = 0
+    for sq in range(64):
+        piece_type = board[sq] if board[sq] <= 6 else board[sq] - 6
+        if KNIGHT <= piece_type <= QUEEN:
+            major_minor += 1
+    endgame = major_minor < 8
+    score = 0
+    for sq in range(64):
+        piece = board[sq]
+        if piece == 0:
+            continue
+        if piece <= 6:
+            piece_type, table_sq, sign = piece, sq, 1
+        else:
+            # Black reads the tables rotated 180 degrees (row and column flipped)
+            piece_type, table_sq, sign = piece - 6, 63 - sq, -1
+        bonus = _KING_ENDGAME_TABLE[table_sq] if piece_type == KING and endgame else _SQUARE_TABLES[piece_type, table_sq]
+        score += sign * (_PIECE_VALUES[piece_type] + bonus)
+    score += (white_moves - black_moves) * 10
+    return score + _king_safety(board, True) - _king_safety(board, False)
+
+
+# The two recursive search functions are compiled per process: numba cannot reload a cached
+# recursive function ("unresolved symbol"), the helpers they call still come from the cache.
+# nogil lets the thread-pool fallback in main.py search without freezing rendering and the UDP listener
+@njit(nogil=True)
+def _negamax(board, depth, alpha, beta, white, castling, halfmove, moves, ply):
+    """Alpha-beta search; the score is from the point of view of the side to move"""
+    n = _generate_moves(board, white, castling, moves[ply])
+    if n == 0:
+        # Checkmate loses for the side to move, stalemate is a draw
+        king_sq = _find_king(board, white)
+        return -MATE_SCORE if king_sq >= 0 and _is_attacked(board, king_sq, not white) else 0
+    if halfmove >= 100:
+        return 0
+    if depth == 0 or ply + 1 >= _MAX_PLY:
+        # Mobility counts the opponent's moves too
+        other = _generate_moves(board, not white, castling, moves[ply + 1])
+        score = _evaluate(board, n, other) if white else _evaluate(board, other, n)
+        return score if white else -score
+    best = -_INF
+    for i in range(n):
+        frm, to, promo = moves[ply, i, 0], moves[ply, i, 1], moves[ply, i, 2]
+        piece = board[frm]
+        captured, new_castling = _make_move(board, frm, to, promo, castling)
+        is_pawn = piece == PAWN or piece == PAWN + 6
+        score = -_negamax(board, depth - 1, -beta, -alpha, not white, new_castling,
+                          0 if captured or is_pawn else halfmove + 1, moves, ply + 1)
+        _unmake_move(board, frm, to, piece, captured)
+        if score > best:
+            best = score
+        if best > alpha:
+            alpha = best
+        if alpha >= beta:
+            break
+    return best
+
+
+@njit(nogil=True)
+def _search_root(board, white, castling, halfmove, depth, seed):
+    """Best (from_sq, to_sq) for the side to move, or (-1, -1) without legal moves"""
+    np.random.seed(seed)
+    moves = np.zeros((_MAX_PLY, _MAX_MOVES, 3), dtype=np.int64)
+    n = _generate_moves(board, white, castling, moves[0])
+    # Shuffle the root moves so equally scored moves vary from game to game
+    for i in range(n - 1, 0, -1):
+        j = np.random.randint(0, i + 1)
+        for k in range(3):
+            moves[0, i, k], moves[0, j, k] = moves[0, j, k], moves[0, i, k]
+    best_from, best_to = -1, -1
+    alpha = -_INF
+    for i in range(n):
+        frm, to, promo = moves[0, i, 0], moves[0, i, 1], moves[0, i, 2]
+        piece = board[frm]
+        captured, new_castling = _make_move(board, frm, to, promo, castling)
+        is_pawn = piece == PAWN or piece == PAWN + 6
+        score = -_negamax(board, depth - 1, -_INF, -alpha, not white, new_castling,
+                          0 if captured or is_pawn else halfmove + 1, moves, 1)
+        _unmake_move(board, frm, to, piece, captured)
+        if best_from < 0 or score > alpha:
+            alpha = score
+            best_from, best_to = frm, to
+    return best_from, best_to
+
+
+def warm_up_search():
+    """Compile (or load the cached) search kernel with a shallow search of the start position"""
+    if numba_available:
+        ChessAI(depth=1).get_best_move(ChessGame({}, game_mode="AI"))
+
+
+def search_best_move(depth, snap):
+    """
+    Worker-process entry point: rebuilds the position from ChessGame.snapshot()
+    output and returns ChessAI(depth).get_best_move() for it.
+    """
+    return ChessAI(depth=depth).get_best_move(ChessGame.from_snapshot(snap))
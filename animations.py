@@ -1,6 +1,7 @@
 import time
 import math
 import pygame
+from utils import get_sys_font
 
 # Animation class for smooth transitions
 class Animation:
@@ -129,7 +130,7 @@ class CheckmateAnimation:
         # Draw "CHECKMATE" text with scaling effect
         scale = 1.0 + math.sin(elapsed * 3) * 0.1  # Scale between 0.9 and 1.1
         font_size = int(36 * scale)
-        font = pygame.font.SysFont('Arial', font_size, bold=True)
+        font = get_sys_font('Arial', font_size, True)
         
         # Create a glowing effect with multiple layers
         for offset in range(5, 0, -1):
@@ -145,7 +146,7 @@ class CheckmateAnimation:
         surface.blit(text, text_rect)
         
         # Draw "Game Over" text
-        font_small = pygame.font.SysFont('Arial', 24, bold=True)
+        font_small = get_sys_font('Arial', 24, True)
         game_over_text = font_small.render("Game Over", True, (255, 255, 255))
         game_over_rect = game_over_text.get_rect(center=(center_x, center_y - 60))
         surface.blit(game_over_text, game_over_rect)
\ No newline at end of file
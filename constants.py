@@ -4,12 +4,14 @@ import pygame
 BOARD_SIZE = 8
 SQUARE_SIZE = 80
 WIDTH = HEIGHT = BOARD_SIZE * SQUARE_SIZE
+BOARD_RECT = pygame.Rect(0, 0, WIDTH, HEIGHT)  # Board area, drawn at the window origin
 SIDEBAR_WIDTH = 350  # Minimum sidebar width
 WINDOW_WIDTH = WIDTH + SIDEBAR_WIDTH  # Default window width
 WINDOW_HEIGHT = HEIGHT  # Default window height
 MIN_WINDOW_WIDTH = WIDTH + 300  # Minimum resizable width
 MIN_WINDOW_HEIGHT = 500  # Minimum resizable height
 FPS = 60
+MENU_FPS = 30  # The mode selection screen only animates slow sine motion
 
 # Colors
 WHITE = (255, 255, 255)
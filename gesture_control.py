@@ -18,18 +18,26 @@ import cv2
 import mediapipe as mp
 import math
 import numpy as np
+import os
 import platform
 import time
 import threading
 import queue
 import sys
+from collections import deque
 import argparse
+import logging
 from typing import Optional, Tuple
+import select
 import socket
 
+# Warnings from the video loop go through logging (rate limited) rather than print
+log = logging.getLogger(__name__)
+
 # Check what OS we're running on and import the right libraries
 current_os = platform.system()
 windows_audio_available = False
+pulse_audio_available = False
 
 # Windows-specific imports (only import if on Windows)
 if current_os == "Windows":
@@ -41,10 +49,14 @@ if current_os == "Windows":
     except ImportError:
         print("Warning: pycaw not installed. Run 'pip install pycaw' for Windows volume control")
         windows_audio_available = False
-elif current_os == "Darwin":  # macOS
-    import os
 elif current_os == "Linux":
     import subprocess
+    # PulseAudio client library: volume changes become one IPC call instead of an amixer fork+exec
+    try:
+        import pulsectl  # type: ignore
+        pulse_audio_available = True
+    except ImportError:
+        pulse_audio_available = False
 
 # Type hints for Windows-only variables (prevents Pylance errors)
 if current_os == "Windows" and windows_audio_available:
@@ -58,6 +70,82 @@ else:
     cast = None  # type: ignore
     POINTER = None  # type: ignore
 
+# Numba is optional: without it the gesture classifier runs as plain Python
+try:
+    from numba import njit
+    numba_available = True
+except ImportError:
+    numba_available = False
+
+    def njit(*args, **kwargs):
+        """Fallback for @njit / @njit(...) that leaves the function as-is"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Result codes of _classify_gesture
+GESTURE_NAMES = (None, "select", "cancel", "confirm")
+DIRECTION_NAMES = ("right", "left", "down", "up")
+
+
+@njit(cache=True)
+def _classify_gesture(fs_buf, fs_count, has_last, last_x, last_y, index_x, index_y, move_threshold):
+    """
+    Vote over the packed finger history and classify the hand pose and index motion.
+
+    Returns (gesture_code, dir_code, steps): gesture_code indexes GESTURE_NAMES,
+    dir_code indexes DIRECTION_NAMES (-1 = no directional move).
+    """
+    # Majority vote per finger bit (thumb, index, middle, ring, pinky)
+    stable_count = 0
+    index_up = False
+    for bit in range(5):
+        votes = 0
+        for i in range(fs_buf.shape[0]):
+            votes += (fs_buf[i] >> bit) & 1
+        if votes > fs_count // 2:
+            stable_count += 1
+            if bit == 1:
+                index_up = True
+
+    # Closed fist -> select, open palm -> cancel, index only -> confirm
+    gesture_code = 0
+    if stable_count == 0:
+        gesture_code = 1
+    elif stable_count >= 4:
+        gesture_code = 2
+    elif index_up and stable_count == 1:
+        gesture_code = 3
+
+    # Directional movement using index fingertip motion
+    dir_code = -1
+    steps = 0
+    if has_last:
+        dx = index_x - last_x
+        dy = index_y - last_y
+        if abs(dx) > move_threshold or abs(dy) > move_threshold:
+            if abs(dx) > abs(dy):
+                steps = max(1, min(3, int(abs(dx) / max(1, move_threshold))))
+                dir_code = 0 if dx > 0 else 1
+            else:
+                steps = max(1, min(3, int(abs(dy) / max(1, move_threshold))))
+                dir_code = 2 if dy > 0 else 3
+    return gesture_code, dir_code, steps
+
+
+@njit(cache=True, fastmath=True)
+def _compute_pinch(thumb_x, thumb_y, index_x, index_y, closest_distance, volume_scale, prev_volume, smoothing):
+    """
+    Pinch distance in pixels, the volume it maps to (clamped to 0-100) and that
+    volume blended into prev_volume by the smoothing factor.
+
+    Returns (distance, target_volume, smoothed_volume).
+    """
+    distance = math.sqrt((index_x - thumb_x) ** 2 + (index_y - thumb_y) ** 2)
+    target = (distance - closest_distance) * volume_scale
+    target = max(0.0, min(100.0, target))
+    return distance, target, prev_volume + smoothing * (target - prev_volume)
+
 
 class HandGestureVolumeControl:
     """
@@ -65,26 +153,45 @@ class HandGestureVolumeControl:
     Optimized to run alongside other applications like the chess game.
     """
     
-    def __init__(self, camera_index: int = 0, window_name: str = "Gesture Volume Control", udp_enabled: bool = False, udp_host: str = "127.0.0.1", udp_port: int = 5006, volume_enabled: bool = False, mirror_x: bool = True, flip_y: bool = False, window_width: int = 640, window_height: int = 480):
+    def __init__(self, camera_index: int = 0, window_name: str = "Gesture Volume Control", udp_enabled: bool = False, udp_host: str = "127.0.0.1", udp_port: int = 5006, volume_enabled: bool = False, mirror_x: bool = True, flip_y: bool = False, window_width: int = 640, window_height: int = 480, model_complexity: int = 0, target_fps: float = 20, inference_width: int = 256, infer_every: int = 2, cv_threads: int = 1, use_opencl: bool = False):
         """
         Initialize the hand gesture volume control system.
         
         Args:
             camera_index: Camera index to use (default: 0)
             window_name: Name for the OpenCV window
+            model_complexity: MediaPipe landmark model (0 = lite, 1 = full)
+            target_fps: How many frames per second are decoded and processed
+            inference_width: Width the frame is downscaled to before hand tracking
+            infer_every: Run hand tracking on every Nth frame while a hand is tracked
+            cv_threads: OpenCV worker threads (process-wide setting)
+            use_opencl: Let OpenCV use OpenCL (process-wide setting)
         """
+        # OpenCV only does small per-frame jobs here; its own thread pool and the OpenCL
+        # probe just contend with MediaPipe
+        cv2.setNumThreads(max(0, cv_threads))
+        cv2.ocl.setUseOpenCL(use_opencl)
         self.window_name = window_name
         self.running = False
         self.thread = None
         self.command_queue = queue.Queue()
+        self._warn_times = {}  # key -> monotonic time of last logged warning
         # UDP command sender (optional)
         self.udp_enabled = udp_enabled
         self.udp_host = udp_host
         self.udp_port = udp_port
         self._last_sent_command = None
         self._last_sent_time = 0
-        self._send_interval = 0.12  # seconds between UDP sends
+        self._send_interval = 0.12  # seconds between repeats of the same command
+        self._global_min_gap = 0.02  # seconds between any two sends
         self.udp_sock = None
+        self._udp_addr = (self.udp_host, int(self.udp_port))
+        # Encoded payloads; the vocabulary is small (commands, cursor tiles, moves) so this stays bounded
+        self._cmd_bytes_cache = {c: c.encode('utf-8') for c in ('select', 'confirm', 'cancel', 'dwell')}
+        self._ack_thread = None
+        # Sends are handed to a sender thread; command_queue stays reserved for loop control ("stop")
+        self._udp_queue = queue.Queue(maxsize=32)
+        self._sender_thread = None
         if self.udp_enabled:
             try:
                 self.udp_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
@@ -99,10 +206,15 @@ class HandGestureVolumeControl:
         self.hands = self.mp_hands.Hands(
             static_image_mode=False,
             max_num_hands=1,  # Only track one hand to avoid confusion
-            min_detection_confidence=0.7,
-            min_tracking_confidence=0.5
+            model_complexity=model_complexity,  # 0 = lite model (~2x faster on CPU, plenty for pinch gestures)
+            min_detection_confidence=0.6,  # palm detector only re-fires when tracking is lost...
+            min_tracking_confidence=0.4    # ...so let the cheap landmark tracker hold on a bit longer
         )
-        self.mp_drawing = mp.solutions.drawing_utils
+        # Landmarks of the tracked hand as one (21, 3) array, refreshed on inference frames only
+        # (float64 so pixel math rounds exactly as the per-attribute reads did)
+        self._landmarks = np.zeros((21, 3), dtype=np.float64)
+        # Skeleton edges as landmark index pairs, so all of them draw in one polylines call
+        self._hand_connections = np.array(sorted(self.mp_hands.HAND_CONNECTIONS), dtype=np.intp)
         
         # Try to find and connect to a working camera
         self.camera = None
@@ -118,6 +230,11 @@ class HandGestureVolumeControl:
         self.camera.set(cv2.CAP_PROP_FRAME_HEIGHT, 360)
         self.camera.set(cv2.CAP_PROP_FPS, 30)
         
+        # Capture runs on its own thread; only the newest frame is kept
+        self._frame_queue = queue.Queue(maxsize=1)
+        self._reader_thread = None
+        self.target_fps = max(1.0, float(target_fps))  # frames decoded per second; extra grabs are discarded
+        
         # Initialize volume control for the current OS
         self._setup_volume_control()
         # Volume feature toggle (disable by default to avoid conflicts with chess control)
@@ -126,6 +243,7 @@ class HandGestureVolumeControl:
         # Gesture detection sensitivity settings
         self.closest_distance = 30    # Minimum finger distance (volume = 0%)
         self.farthest_distance = 200  # Maximum finger distance (volume = 100%)
+        self._volume_scale = 100.0 / (self.farthest_distance - self.closest_distance)  # distance -> percent
         
         # Start with the current system volume instead of a fixed value
         self.current_volume_level = self._get_system_volume()
@@ -133,30 +251,84 @@ class HandGestureVolumeControl:
         
         # Performance optimization variables
         self.last_volume_set = 0
-        self.volume_update_threshold = 2.0  # Only update volume if change is > 2%
+        self.volume_update_threshold = 1.0  # Only update volume if change is >= 1%
         self.last_volume_update_time = 0
-        self.volume_update_interval = 0.1  # Update volume max every 100ms for better performance
+        self.volume_update_interval = 0.05  # Set the system volume at most every 50ms
+        self._volume_queue = queue.Queue(maxsize=1)  # latest target volume for the worker thread
+        self._volume_thread = None
         
         # UI and display variables
-        self.frame_rate = 0
-        self.last_frame_time = 0
+        self._frame_times = deque(maxlen=30)  # monotonic_ns stamps of recent frames
+        self._frame_tick = 0
+        self._fps_text = ""  # refreshed every 15 frames, reused in between
+        # Pre-rendered HUD stamps, rebuilt only when their content changes
+        self._fps_stamp = None
+        self._fps_stamp_text = None
+        self._volume_stamp = None
+        self._volume_stamp_key = None
         self.show_debug_info = True
+        # Key code -> handler (returns False to quit); no runtime window resize hotkeys to avoid accidental changes
+        self._key_actions = {
+            ord('q'): self._key_quit,
+            27: self._key_quit,  # ESC
+            ord('r'): self._key_reset_volume,
+            ord('d'): self._key_toggle_debug,
+            ord('c'): self._key_calibrate,
+            ord('s'): self._key_set_minimum,
+            ord('l'): self._key_set_maximum,
+            ord('u'): self._key_toggle_udp,
+            ord('v'): self._key_toggle_volume,
+            ord('['): self._key_decrease_threshold,
+            ord(']'): self._key_increase_threshold,
+            ord('m'): self._key_toggle_mirror,
+            ord('f'): self._key_toggle_flip,
+        }
+        # Inference cadence (landmarks are reused on skipped frames)
+        self._infer_every = max(1, int(infer_every))
+        self._frame_idx = 0
+        self._last_landmarks = None
+        self._no_hand_streak = 0       # consecutive inferences without a hand
+        self._absent_frames = 5        # after this many, treat the hand as absent
+        self._absent_infer_every = 2   # inference cadence while the hand is absent
+        self._idle_frames = 15         # after this many, the user has stopped gesturing...
+        self._idle_infer_every = 3     # ...so back off further
+        # Inference input: oriented, downscaled copy of the frame (built by _prepare_inference_input)
+        # Landmarks are normalized, so downstream pixel math is unaffected by this size
+        self.inference_width = max(64, int(inference_width))  # the hand networks work at ~224px internally
+        self._warp_key = None
+        self._warp_matrix = None
+        self._warp_size = None
+        self._warp_buf = None
+        self._rgb_buf = None  # reused RGB copy of the warp buffer
         # Orientation settings (so camera overlay matches Pygame board)
         self.mirror_x = mirror_x  # Horizontal mirror (selfie view). Default True to match intuitive left/right.
         self.flip_y = flip_y      # Vertical flip (use if camera is mounted upside-down)
         # Window sizing
         self.window_width = max(240, int(window_width))
         self.window_height = max(180, int(window_height))
+        # Reused resize target for the display window
+        self._display_buf = np.empty((self.window_height, self.window_width, 3), dtype=np.uint8)
 
         # Gesture/command detection helpers (initialized inside constructor)
         self.last_index_pos = None
         self.move_threshold = 40  # pixels to trigger a directional move (tweakable)
-        self.finger_state_history = []
         self.finger_history_length = 7
+        # Finger-up history ring buffer, one packed byte per frame (bit 0 = thumb ... bit 4 = pinky)
+        self._fs_buf = np.zeros(self.finger_history_length, dtype=np.uint8)
+        self._fs_idx = 0
+        self._fs_count = 0
+        # Compile the classifier now rather than on the first frame with a hand
+        _classify_gesture(self._fs_buf, 0, False, 0, 0, 0, 0, self.move_threshold)
+        _compute_pinch(0, 0, 0, 0, self.closest_distance, self._volume_scale, 0.0, self.smoothing_factor)
         self.stable_gesture = None
         self.stable_count = 0
         self.stable_required = 4  # require gesture to be stable for N frames
-        self.last_ack = None  # (cmd, timestamp)
+        self.last_ack = None  # (cmd, monotonic timestamp)
+        # Board overlay caches, keyed by frame / tile shape
+        self._grid_cache = {}
+        self._red_tile_cache = {}
+        self._tile_labels = [f"{chr(97 + c)}{8 - r}" for r in range(8) for c in range(8)]
+        self._label_imgs = {}  # tile index -> rendered label stamp
         # Cursor smoothing (continuous index finger -> board square)
         self.cursor_row_f = None
         self.cursor_col_f = None
@@ -183,6 +355,12 @@ class HandGestureVolumeControl:
             try:
                 test_cap = cv2.VideoCapture(camera_index)
                 if test_cap.isOpened():
+                    # Ask USB cameras for compressed MJPG (less bus bandwidth) at a fixed rate;
+                    # drivers that don't support either simply ignore the request
+                    test_cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+                    test_cap.set(cv2.CAP_PROP_FPS, 30)
+                    # Keep only the newest frame in the driver queue (lower latency)
+                    test_cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
                     # Test if we can actually read frames
                     success, test_frame = test_cap.read()
                     if success and test_frame is not None:
@@ -197,6 +375,7 @@ class HandGestureVolumeControl:
         
     def _setup_volume_control(self):
         """Initialize volume control based on the operating system"""
+        self._pulse = None
         if current_os == "Windows" and windows_audio_available:
             try:
                 # Get the default audio device
@@ -212,6 +391,12 @@ class HandGestureVolumeControl:
                 self.volume_controller = None
         else:
             self.volume_controller = None
+            if current_os == "Linux" and pulse_audio_available:
+                try:
+                    # threading_lock: the volume worker and the video loop both use this client
+                    self._pulse = pulsectl.Pulse('chess-gesture-control', threading_lock=True)
+                except Exception as error:
+                    print(f"PulseAudio unavailable, falling back to amixer: {error}")
             print(f"Volume control ready for {current_os}")
     
     def _get_system_volume(self) -> float:
@@ -227,6 +412,9 @@ class HandGestureVolumeControl:
                 # Use AppleScript to get volume
                 result = os.popen("osascript -e 'output volume of (get volume settings)'").read().strip()
                 return float(result) if result.isdigit() else 50
+            elif current_os == "Linux" and self._pulse is not None:
+                sink = self._pulse.sink_default_get()
+                return max(0, min(100, self._pulse.volume_get_all_chans(sink) * 100))
             elif current_os == "Linux":
                 # Use amixer to get ALSA volume
                 result = subprocess.run(['amixer', '-D', 'pulse', 'sget', 'Master'], 
@@ -241,40 +429,72 @@ class HandGestureVolumeControl:
         return 50  # Safe default if we can't read the volume
     
     def _change_system_volume(self, percentage: float):
-        """Set the system volume to a specific percentage (with throttling)"""
-        current_time = time.time()
+        """Hand the latest target volume to the volume worker (which debounces the OS calls)"""
+        clamped_percentage = max(0, min(100, percentage))
         
-        # Throttle volume updates to reduce system calls
-        if (current_time - self.last_volume_update_time < self.volume_update_interval or
-            abs(percentage - self.last_volume_set) < self.volume_update_threshold):
-            return
-            
+        # 1-slot queue: replace any value the worker hasn't picked up yet
         try:
-            clamped_percentage = max(0, min(100, percentage))
+            self._volume_queue.put_nowait(clamped_percentage)
+        except queue.Full:
+            try:
+                self._volume_queue.get_nowait()
+                self._volume_queue.put_nowait(clamped_percentage)
+            except (queue.Empty, queue.Full):
+                pass
+    
+    def _volume_worker(self):
+        """Apply queued volume changes so audio APIs never block the video loop"""
+        pending = None
+        wait = 0.5
+        while self.running:
+            try:
+                pending = self._volume_queue.get(timeout=wait)
+            except queue.Empty:
+                pass
+            wait = 0.5
+            if pending is None:
+                continue
             
+            # Debounce: at most one OS call per interval. A value that arrives too early is
+            # kept and applied when the interval ends, so the final volume always lands.
+            current_time = time.monotonic()
+            remaining = self.volume_update_interval - (current_time - self.last_volume_update_time)
+            if remaining > 0:
+                wait = remaining
+                continue
+            if abs(pending - self.last_volume_set) >= self.volume_update_threshold:
+                self._apply_system_volume(pending)
+                self.last_volume_set = pending
+                self.last_volume_update_time = current_time
+            pending = None
+    
+    def _apply_system_volume(self, percentage: float):
+        """Set the system volume to a specific percentage (blocking OS call)"""
+        try:
             if current_os == "Windows" and self.volume_controller:
                 # Convert percentage back to dB
-                db_level = self.min_volume_db + (self.max_volume_db - self.min_volume_db) * (clamped_percentage / 100)
+                db_level = self.min_volume_db + (self.max_volume_db - self.min_volume_db) * (percentage / 100)
                 self.volume_controller.SetMasterVolumeLevel(db_level, None)
             elif current_os == "Darwin":  # macOS
                 # Use AppleScript to set volume
-                os.system(f"osascript -e 'set volume output volume {int(clamped_percentage)}' 2>/dev/null")
+                os.system(f"osascript -e 'set volume output volume {int(percentage)}' 2>/dev/null")
+            elif current_os == "Linux" and self._pulse is not None:
+                sink = self._pulse.sink_default_get()
+                self._pulse.volume_set_all_chans(sink, percentage / 100.0)
             elif current_os == "Linux":
                 # Use amixer to set ALSA volume
-                subprocess.run(['amixer', '-D', 'pulse', 'sset', 'Master', f'{int(clamped_percentage)}%'],
+                subprocess.run(['amixer', '-D', 'pulse', 'sset', 'Master', f'{int(percentage)}%'],
                              stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-            
-            self.last_volume_set = clamped_percentage
-            self.last_volume_update_time = current_time
-            
         except Exception as error:
-            print(f"Failed to set volume: {error}")
+            self._warn_once("volume", f"Failed to set volume: {error}")
     
-    def _calculate_finger_distance(self, point1: Tuple[int, int], point2: Tuple[int, int]) -> float:
-        """Calculate the pixel distance between two finger positions"""
-        dx = point2[0] - point1[0]
-        dy = point2[1] - point1[1]
-        return math.sqrt(dx * dx + dy * dy)
+    def _warn_once(self, key: str, msg: str, interval: float = 10.0):
+        """Log a warning at most once per interval for a given key"""
+        now = time.monotonic()
+        last = self._warn_times.get(key)
+        if last is None or now - last >= interval:
+            self._warn_times[key] = now
+            log.warning(msg)
     
     def _draw_volume_indicator(self, frame, volume_level: float):
         """Draw a compact volume bar on the screen"""
@@ -282,24 +502,36 @@ class HandGestureVolumeControl:
         bar_left = 10
         bar_top = 10
         bar_width = 150
+        
+        # The bar only looks different when the fill or the percentage changes, so reuse its stamp
+        fill_width = int(bar_width * volume_level / 100)
+        key = (fill_width, int(volume_level), volume_level > 20)
+        if key != self._volume_stamp_key:
+            self._volume_stamp = self._render_volume_stamp(bar_width, fill_width, volume_level)
+            self._volume_stamp_key = key
+        self._blit_stamp(frame, self._volume_stamp, bar_left, bar_top)
+    
+    def _render_volume_stamp(self, bar_width: int, fill_width: int, volume_level: float):
+        """Render the volume bar and its percentage label into a stamp anchored at the bar's top-left"""
         bar_height = 15
+        width, height = bar_width + 50, bar_height + 6
+        bar_img = np.zeros((height, width, 3), dtype=np.uint8)
+        bar_mask = np.zeros((height, width), dtype=np.uint8)
         
         # Draw the background bar (gray)
-        cv2.rectangle(frame, (bar_left, bar_top), 
-                     (bar_left + bar_width, bar_top + bar_height), 
-                     (50, 50, 50), -1)
+        cv2.rectangle(bar_img, (0, 0), (bar_width, bar_height), (50, 50, 50), -1)
+        cv2.rectangle(bar_mask, (0, 0), (bar_width, bar_height), 255, -1)
         
         # Draw the filled portion based on volume level
-        fill_width = int(bar_width * volume_level / 100)
         bar_color = (0, 255, 0) if volume_level > 20 else (0, 165, 255)  # Green or orange
-        cv2.rectangle(frame, (bar_left, bar_top), 
-                     (bar_left + fill_width, bar_top + bar_height), 
-                     bar_color, -1)
+        cv2.rectangle(bar_img, (0, 0), (fill_width, bar_height), bar_color, -1)
         
         # Add text showing the exact percentage
-        cv2.putText(frame, f'{int(volume_level)}%', 
-                   (bar_left + bar_width + 10, bar_top + 12), 
-                   cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+        cv2.putText(bar_img, f'{int(volume_level)}%', (bar_width + 10, 12),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
+        cv2.putText(bar_mask, f'{int(volume_level)}%', (bar_width + 10, 12),
+                    cv2.FONT_HERSHEY_SIMPLEX, 0.4, 255, 1)
+        return self._make_stamp(bar_img, bar_mask, (0, 0))
 
     def _draw_board_overlay(self, frame, current_tile: Optional[Tuple[int, int]]):
         """Draw a light 8x8 grid with a red highlight on the current cursor tile."""
@@ -307,38 +539,89 @@ class HandGestureVolumeControl:
         tile_w = w // 8
         tile_h = h // 8
 
-        # Grid lines
-        grid_color_light = (80, 80, 80)
-        for r in range(9):
-            y = int(r * tile_h)
-            cv2.line(frame, (0, y), (w, y), grid_color_light, 1)
-        for c in range(9):
-            x = int(c * tile_w)
-            cv2.line(frame, (x, 0), (x, h), grid_color_light, 1)
+        # Grid lines (rendered once per frame size, then stamped through a mask)
+        grid = self._grid_cache.get((h, w))
+        if grid is None:
+            grid_color_light = (80, 80, 80)
+            grid_img = np.zeros((h, w, 3), dtype=np.uint8)
+            grid_mask = np.zeros((h, w), dtype=np.uint8)
+            # All 18 lines as open 2-point polylines, drawn in one call per target
+            grid_pts = ([np.array([[0, r * tile_h], [w, r * tile_h]], np.int32) for r in range(9)] +
+                        [np.array([[c * tile_w, 0], [c * tile_w, h]], np.int32) for c in range(9)])
+            cv2.polylines(grid_img, grid_pts, False, grid_color_light, 1)
+            cv2.polylines(grid_mask, grid_pts, False, 255, 1)
+            grid = self._grid_cache[(h, w)] = (grid_img, grid_mask)
+        cv2.copyTo(grid[0], grid[1], frame)
 
         if current_tile is not None:
             row, col = current_tile
             x1, y1 = int(col * tile_w), int(row * tile_h)
             x2, y2 = int((col + 1) * tile_w), int((row + 1) * tile_h)
 
-            # Red translucent fill
-            overlay = frame.copy()
-            cv2.rectangle(overlay, (x1, y1), (x2, y2), (20, 20, 255), thickness=-1)
-            cv2.addWeighted(overlay, 0.2, frame, 0.8, 0, frame)
+            # Red translucent fill, blended straight into the tile (no full-frame clone)
+            tile = frame[y1:y2, x1:x2]
+            red_tile = self._red_tile_cache.get(tile.shape)
+            if red_tile is None:
+                red_tile = self._red_tile_cache[tile.shape] = np.full(tile.shape, (20, 20, 255), dtype=np.uint8)
+            cv2.addWeighted(tile, 0.8, red_tile, 0.2, 0, dst=tile)
             # Solid red border
             cv2.rectangle(frame, (x1, y1), (x2, y2), (20, 20, 255), thickness=3)
 
-            # Draw tile label (e.g., e4)
+            # Draw tile label (e.g., e4) from the pre-rendered stamp
             try:
-                file_char = chr(97 + col)
-                rank_char = str(8 - row)
-                label = f"{file_char}{rank_char}"
-                pos = (x1 + 6, y1 + 20)
-                cv2.putText(frame, label, pos, cv2.FONT_HERSHEY_DUPLEX, 0.7, (0, 0, 0), 3)
-                cv2.putText(frame, label, pos, cv2.FONT_HERSHEY_DUPLEX, 0.7, (230, 230, 230), 1)
+                idx = row * 8 + col
+                stamp = self._label_imgs.get(idx)
+                if stamp is None:
+                    stamp = self._label_imgs[idx] = self._render_label(self._tile_labels[idx])
+                self._blit_stamp(frame, stamp, x1 + 6, y1 + 20)
             except Exception:
                 pass
     
+    def _render_label(self, label: str, fill=(230, 230, 230)):
+        """Render outlined text once as a stamp (see _blit_stamp)"""
+        font, scale = cv2.FONT_HERSHEY_DUPLEX, 0.7
+        (text_w, text_h), baseline = cv2.getTextSize(label, font, scale, 3)
+        pad = 3
+        width, height = text_w + 2 * pad, text_h + baseline + 2 * pad
+        origin = (pad, pad + text_h)
+        label_img = np.zeros((height, width, 3), dtype=np.uint8)
+        label_mask = np.zeros((height, width), dtype=np.uint8)
+        cv2.putText(label_img, label, origin, font, scale, (0, 0, 0), 3)
+        cv2.putText(label_img, label, origin, font, scale, fill, 1)
+        cv2.putText(label_mask, label, origin, font, scale, 255, 3)
+        return self._make_stamp(label_img, label_mask, (-origin[0], -origin[1]))
+    
+    @staticmethod
+    def _make_stamp(image, coverage, offset):
+        """
+        Package art drawn on black plus its coverage mask as a stamp.
+
+        Drawing on black leaves the colors premultiplied by coverage, so compositing is
+        frame * (1 - coverage) + image, which also keeps anti-aliased text edges right.
+        """
+        inv_alpha = cv2.cvtColor(255 - coverage, cv2.COLOR_GRAY2BGR)
+        return image, inv_alpha, offset
+    
+    def _blit_stamp(self, frame, stamp, x: int, y: int):
+        """Composite a pre-rendered stamp onto the frame with its origin at (x, y), clipped to the frame"""
+        stamp_img, inv_alpha, (off_x, off_y) = stamp
+        sx, sy = x + off_x, y + off_y
+        sh, sw = inv_alpha.shape[:2]
+        h, w = frame.shape[:2]
+        cx1, cy1 = max(0, sx), max(0, sy)
+        cx2, cy2 = min(w, sx + sw), min(h, sy + sh)
+        if cx2 > cx1 and cy2 > cy1:
+            roi = frame[cy1:cy2, cx1:cx2]
+            cv2.multiply(roi, inv_alpha[cy1 - sy:cy2 - sy, cx1 - sx:cx2 - sx], dst=roi, scale=1.0 / 255)
+            cv2.add(roi, stamp_img[cy1 - sy:cy2 - sy, cx1 - sx:cx2 - sx], dst=roi)
+    
+    def _draw_hand_skeleton(self, frame, points):
+        """Draw the hand connections and joints from the (21, 2) pixel array (drawing_utils' default look)"""
+        cv2.polylines(frame, points[self._hand_connections], False, (224, 224, 224), 2)
+        for x, y in points.tolist():
+            cv2.circle(frame, (x, y), 3, (224, 224, 224), 2)
+            cv2.circle(frame, (x, y), 2, (0, 0, 255), 2)
+    
     def _draw_finger_tracking(self, frame, distance: float, thumb_pos: Tuple[int, int], index_pos: Tuple[int, int]):
         """Draw visual feedback for finger tracking"""
         thumb_x, thumb_y = thumb_pos
@@ -359,217 +642,257 @@ class HandGestureVolumeControl:
                        (middle_x - 25, middle_y - 15), 
                        cv2.FONT_HERSHEY_SIMPLEX, 0.4, (255, 255, 255), 1)
     
+    def _prepare_inference_input(self, frame):
+        """Mirror/flip and downscale a raw camera frame for MediaPipe in a single cv2.warpAffine pass"""
+        src_h, src_w = frame.shape[:2]
+        key = (src_w, src_h, self.mirror_x, self.flip_y)
+        if key != self._warp_key:
+            # Landmarks come back normalized, so a smaller input maps straight onto the display frame
+            scale = min(1.0, self.inference_width / src_w)
+            dst_w, dst_h = int(round(src_w * scale)), int(round(src_h * scale))
+            # Pixel-centre mapping: x' = s*(x + 0.5) - 0.5, or s*(W - x - 0.5) - 0.5 when mirrored
+            if self.mirror_x:
+                ax, bx = -scale, scale * (src_w - 0.5) - 0.5
+            else:
+                ax, bx = scale, 0.5 * scale - 0.5
+            if self.flip_y:
+                ay, by = -scale, scale * (src_h - 0.5) - 0.5
+            else:
+                ay, by = scale, 0.5 * scale - 0.5
+            self._warp_matrix = np.float32([[ax, 0, bx], [0, ay, by]])
+            self._warp_size = (dst_w, dst_h)
+            self._warp_buf = np.empty((dst_h, dst_w, 3), dtype=np.uint8)
+            self._warp_key = key
+        cv2.warpAffine(frame, self._warp_matrix, self._warp_size, dst=self._warp_buf,
+                       flags=cv2.INTER_LINEAR, borderMode=cv2.BORDER_REPLICATE)
+        return self._warp_buf
+    
+    def _reader_loop(self):
+        """Capture frames on a background thread so decode overlaps with inference"""
+        last_retrieve_time = 0.0
+        while self.running and self.camera is not None and self.camera.isOpened():
+            # grab() every tick keeps the driver buffer fresh; only decode frames we will use
+            if not self.camera.grab():
+                time.sleep(0.01)
+                continue
+            now = time.monotonic()
+            if now - last_retrieve_time < 1.0 / self.target_fps:
+                continue
+            last_retrieve_time = now
+            success, frame = self.camera.retrieve()
+            if not success:
+                continue
+            # Drop the stale frame if the video loop hasn't picked it up yet
+            try:
+                self._frame_queue.put_nowait(frame)
+            except queue.Full:
+                try:
+                    self._frame_queue.get_nowait()
+                except queue.Empty:
+                    pass
+                try:
+                    self._frame_queue.put_nowait(frame)
+                except queue.Full:
+                    pass
+    
     def _process_video_frame(self):
         """Process one frame from the camera"""
         if not self.camera or not self.camera.isOpened():
             return None
             
-        success, frame = self.camera.read()
-        if not success:
+        try:
+            frame = self._frame_queue.get(timeout=0.5)
+        except queue.Empty:
             return None
         
-        # Apply orientation so camera overlay matches board
-        if self.mirror_x:
-            frame = cv2.flip(frame, 1)
-        if self.flip_y:
-            frame = cv2.flip(frame, 0)
-        
-        # Convert BGR to RGB for MediaPipe
-        rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        # Run MediaPipe only every Nth frame; hand poses change at human speed,
+        # so the frames in between reuse the last landmarks
+        self._frame_idx += 1
+        if self._last_landmarks:
+            run_inference = self._frame_idx % self._infer_every == 0
+        elif self._no_hand_streak >= self._absent_frames:
+            # No hand for a while: poll the palm detector at a reduced rate, backing off more when idle
+            if self._no_hand_streak >= self._idle_frames:
+                run_inference = self._frame_idx % self._idle_infer_every == 0
+            else:
+                run_inference = self._frame_idx % self._absent_infer_every == 0
+        else:
+            run_inference = True
+        if run_inference:
+            # Orient + downscale in one warp pass, then convert BGR to RGB for MediaPipe
+            small_frame = self._prepare_inference_input(frame)
+            if self._rgb_buf is None or self._rgb_buf.shape != small_frame.shape:
+                self._rgb_buf = np.empty_like(small_frame)
+            rgb_frame = cv2.cvtColor(small_frame, cv2.COLOR_BGR2RGB, dst=self._rgb_buf)
+            
+            # Look for hands in the frame
+            hand_results = self.hands.process(rgb_frame)
+            self._last_landmarks = hand_results.multi_hand_landmarks
+            self._no_hand_streak = 0 if self._last_landmarks else self._no_hand_streak + 1
+            if self._last_landmarks:
+                # Copy the first hand out of the protobuf once; skipped frames reuse the array
+                lms = self._last_landmarks[0].landmark
+                self._landmarks[:] = np.fromiter((c for p in lms for c in (p.x, p.y, p.z)),
+                                                 dtype=np.float64, count=63).reshape(21, 3)
         
-        # Look for hands in the frame
-        hand_results = self.hands.process(rgb_frame)
+        # Apply orientation so camera overlay matches board; the reader hands over a fresh
+        # array each time, so flip it in place (both axes in a single pass when needed)
+        if self.mirror_x or self.flip_y:
+            flip_code = -1 if (self.mirror_x and self.flip_y) else (1 if self.mirror_x else 0)
+            cv2.flip(frame, flip_code, dst=frame)
         
         finger_distance = 0
         target_volume = self.current_volume_level
         
-        if hand_results.multi_hand_landmarks:
-            # Process only the first hand for better performance
-            hand_landmarks = hand_results.multi_hand_landmarks[0]
-            
-            # Draw hand landmarks (simplified for performance)
-            self.mp_drawing.draw_landmarks(frame, hand_landmarks, self.mp_hands.HAND_CONNECTIONS)
-            
+        if self._last_landmarks:
             # Get frame dimensions once
             height, width = frame.shape[:2]
             
-            # Extract only the landmarks we need (thumb tip and index tip)
-            thumb_landmark = hand_landmarks.landmark[4]  # Thumb tip
-            index_landmark = hand_landmarks.landmark[8]  # Index tip
+            # Pixel coordinates of all 21 landmarks in one vectorized pass
+            points = (self._landmarks[:, :2] * (width, height)).astype(np.int32)
             
-            # Convert to pixel coordinates
-            thumb_x = int(thumb_landmark.x * width)
-            thumb_y = int(thumb_landmark.y * height)
-            index_x = int(index_landmark.x * width)
-            index_y = int(index_landmark.y * height)
+            # Draw hand landmarks (simplified for performance)
+            self._draw_hand_skeleton(frame, points)
             
-            # Calculate distance between fingertips
-            finger_distance = self._calculate_finger_distance(
-                (thumb_x, thumb_y), (index_x, index_y)
-            )
+            # Thumb tip and index tip
+            thumb_x, thumb_y = points[4].tolist()
+            index_x, index_y = points[8].tolist()
             
-            # Map the distance to a volume percentage (only if enabled)
+            # Distance between fingertips and the smoothed volume it maps to
+            finger_distance, pinch_volume, smoothed_volume = _compute_pinch(
+                thumb_x, thumb_y, index_x, index_y, self.closest_distance,
+                self._volume_scale, self.current_volume_level, self.smoothing_factor)
+            
+            # Apply the volume only if enabled (and only for fresh landmarks, so the smoothing
+            # does not advance on frames that reuse the last ones)
             if self.volume_enabled:
-                target_volume = np.interp(finger_distance, 
-                                        [self.closest_distance, self.farthest_distance], 
-                                        [0, 100])
-                target_volume = max(0, min(100, target_volume))  # Clamp to 0-100
-                # Apply smoothing to avoid jumpy volume changes
-                self.current_volume_level = (
-                    self.current_volume_level * (1 - self.smoothing_factor) + 
-                    target_volume * self.smoothing_factor
-                )
-                # Actually change the system volume (with throttling)
-                self._change_system_volume(self.current_volume_level)
+                target_volume = pinch_volume
+                if run_inference:
+                    self.current_volume_level = smoothed_volume
+                    # Actually change the system volume (with throttling)
+                    self._change_system_volume(self.current_volume_level)
             
             # Draw the visual feedback
             self._draw_finger_tracking(frame, finger_distance, (thumb_x, thumb_y), (index_x, index_y))
 
-            # --- Simple gesture detection for chess control ---
-            # Determine which fingers are up (basic heuristic)
-            fingers_up = 0
-            finger_up_flags = [False] * 5  # thumb, index, middle, ring, pinky
-
-            # Landmarks indices: thumb_tip=4, index_tip=8, middle_tip=12, ring_tip=16, pinky_tip=20
-            tips = [4, 8, 12, 16, 20]
-            pips = [2, 6, 10, 14, 18]
-            for i, tip_idx in enumerate(tips):
-                tip = hand_landmarks.landmark[tip_idx]
-                pip = hand_landmarks.landmark[pips[i]]
-                # For fingers (except thumb) compare y coordinates (smaller y is up in image coords)
-                if i == 0:
-                    # Thumb: compare x to pip to detect extended thumb (very simple)
-                    if (tip.x - pip.x) * (1 if thumb_x < index_x else -1) > 0.03:
-                        finger_up_flags[i] = True
+            # Frames that reuse the last landmarks only redraw them: the finger history, stability
+            # count, directional detection and cursor advance once per real detection
+            if run_inference:
+                # --- Simple gesture detection for chess control ---
+                # Determine which fingers are up (basic heuristic), packed straight into one byte:
+                # bit 0 thumb, 1 index, 2 middle, 3 ring, 4 pinky. Only the 10 tip/joint landmarks are read.
+                # Thumb: compare x to its joint to detect an extended thumb (very simple)
+                # Other fingers: compare y coordinates (smaller y is up in image coords)
+                lm_x = self._landmarks[:, 0].tolist()
+                lm_y = self._landmarks[:, 1].tolist()
+                thumb_dir = 1 if thumb_x < index_x else -1
+                packed_fingers = (((lm_x[4] - lm_x[2]) * thumb_dir > 0.03)
+                                  | ((lm_y[8] < lm_y[6] - 0.02) << 1)
+                                  | ((lm_y[12] < lm_y[10] - 0.02) << 2)
+                                  | ((lm_y[16] < lm_y[14] - 0.02) << 3)
+                                  | ((lm_y[20] < lm_y[18] - 0.02) << 4))
+
+                # Keep a short history (ring buffer) to avoid flicker
+                self._fs_buf[self._fs_idx] = packed_fingers
+                self._fs_idx = (self._fs_idx + 1) % self.finger_history_length
+                self._fs_count = min(self._fs_count + 1, self.finger_history_length)
+
+                # Majority vote, gesture candidate and directional motion in one compiled call
+                if self.last_index_pos is not None:
+                    last_x, last_y, has_last = self.last_index_pos[0], self.last_index_pos[1], True
                 else:
-                    if tip.y < pip.y - 0.02:
-                        finger_up_flags[i] = True
-
-            fingers_up = sum(1 for f in finger_up_flags if f)
-
-            # Keep a short history to avoid flicker
-            self.finger_state_history.append(tuple(finger_up_flags))
-            if len(self.finger_state_history) > self.finger_history_length:
-                self.finger_state_history.pop(0)
-
-            # Majority voting over history
-            votes = [0] * 5
-            for h in self.finger_state_history:
-                for i, v in enumerate(h):
-                    votes[i] += 1 if v else 0
-            stable_flags = [votes[i] > (len(self.finger_state_history) // 2) for i in range(5)]
-            stable_count = sum(1 for f in stable_flags if f)
-
-            # Detect gestures (with hysteresis and stability requirement)
-            gesture_candidate = None
-            # Closed fist -> select (no fingers up)
-            if stable_count == 0:
-                gesture_candidate = "select"
-            # Open palm -> cancel
-            elif stable_count >= 4:
-                gesture_candidate = "cancel"
-            # One finger (index) up -> confirm
-            elif stable_flags[1] and not any(stable_flags[i] for i in [0,2,3,4]):
-                gesture_candidate = "confirm"
-
-            # Directional movement using index fingertip motion (require persistent motion)
-            directional = None
-            if self.last_index_pos is not None:
-                dx = index_x - self.last_index_pos[0]
-                dy = index_y - self.last_index_pos[1]
-                if abs(dx) > self.move_threshold or abs(dy) > self.move_threshold:
-                    if abs(dx) > abs(dy):
-                        steps = int(abs(dx) / max(1, self.move_threshold))
-                        steps = max(1, min(3, steps))
-                        directional = f"move_right_{steps}" if dx > 0 else f"move_left_{steps}"
-                    else:
-                        steps = int(abs(dy) / max(1, self.move_threshold))
-                        steps = max(1, min(3, steps))
-                        directional = f"move_down_{steps}" if dy > 0 else f"move_up_{steps}"
+                    last_x, last_y, has_last = 0, 0, False
+                gesture_code, dir_code, steps = _classify_gesture(
+                    self._fs_buf, self._fs_count, has_last, last_x, last_y,
+                    index_x, index_y, self.move_threshold)
+                gesture_candidate = GESTURE_NAMES[gesture_code]
+                directional = f"move_{DIRECTION_NAMES[dir_code]}_{steps}" if dir_code >= 0 else None
 
-            # Update index position history smoothing by simple low-pass
-            if self.last_index_pos is None:
-                self.last_index_pos = (index_x, index_y)
-            else:
-                sx = int(self.last_index_pos[0] * 0.6 + index_x * 0.4)
-                sy = int(self.last_index_pos[1] * 0.6 + index_y * 0.4)
-                self.last_index_pos = (sx, sy)
+                # Update index position history smoothing by simple low-pass
+                if self.last_index_pos is None:
+                    self.last_index_pos = (index_x, index_y)
+                else:
+                    sx = int(self.last_index_pos[0] * 0.6 + index_x * 0.4)
+                    sy = int(self.last_index_pos[1] * 0.6 + index_y * 0.4)
+                    self.last_index_pos = (sx, sy)
 
-            # Map index fingertip to board cursor continuously
-            # Convert to tile indices with smoothing
-            height, width = frame.shape[:2]
-            raw_col_f = (index_x / max(1, width)) * 8.0
-            raw_row_f = (index_y / max(1, height)) * 8.0
-            if self.cursor_col_f is None:
-                self.cursor_col_f = raw_col_f
-                self.cursor_row_f = raw_row_f
-            else:
-                self.cursor_col_f = self.cursor_col_f * (1 - self.cursor_alpha) + raw_col_f * self.cursor_alpha
-                self.cursor_row_f = self.cursor_row_f * (1 - self.cursor_alpha) + raw_row_f * self.cursor_alpha
+                # Map index fingertip to board cursor continuously
+                # Convert to tile indices with smoothing
+                height, width = frame.shape[:2]
+                raw_col_f = (index_x / max(1, width)) * 8.0
+                raw_row_f = (index_y / max(1, height)) * 8.0
+                if self.cursor_col_f is None:
+                    self.cursor_col_f = raw_col_f
+                    self.cursor_row_f = raw_row_f
+                else:
+                    self.cursor_col_f = self.cursor_col_f * (1 - self.cursor_alpha) + raw_col_f * self.cursor_alpha
+                    self.cursor_row_f = self.cursor_row_f * (1 - self.cursor_alpha) + raw_row_f * self.cursor_alpha
 
-            quant_col = int(max(0, min(7, round(self.cursor_col_f))))
-            quant_row = int(max(0, min(7, round(self.cursor_row_f))))
-            current_tile = (quant_row, quant_col)
+                quant_col = int(max(0, min(7, round(self.cursor_col_f))))
+                quant_row = int(max(0, min(7, round(self.cursor_row_f))))
+                current_tile = (quant_row, quant_col)
 
-            # Draw grid overlay and highlight the current tile for user clarity
-            self._draw_board_overlay(frame, current_tile)
-
-            # Send cursor tile updates when changed
-            nowt = time.time()
-            if current_tile != self._last_cursor_tile:
-                self._send_udp_command(f"cursor:{quant_row},{quant_col}")
-                self._last_cursor_tile = current_tile
-                self._last_cursor_time = nowt
-            else:
-                # If dwelling on same tile with a hand in view (finger_distance>0), send a dwell
-                if finger_distance > 0 and (nowt - self._last_cursor_time) * 1000 >= self._dwell_ms:
-                    self._send_udp_command("dwell")
+                # Send cursor tile updates when changed
+                nowt = time.monotonic()
+                if current_tile != self._last_cursor_tile:
+                    self._send_udp_command(f"cursor:{quant_row},{quant_col}")
+                    self._last_cursor_tile = current_tile
                     self._last_cursor_time = nowt
-
-            # Prefer directional if present
-            if directional:
-                # To avoid flicker, only accept if enough time passed or it changed
-                gesture_to_send = directional
-            else:
-                # Require stability for non-directional gestures
-                if gesture_candidate == self.stable_gesture:
-                    self.stable_count += 1
                 else:
-                    self.stable_gesture = gesture_candidate
-                    self.stable_count = 1
+                    # If dwelling on same tile with a hand in view (finger_distance>0), send a dwell
+                    if finger_distance > 0 and (nowt - self._last_cursor_time) * 1000 >= self._dwell_ms:
+                        self._send_udp_command("dwell")
+                        self._last_cursor_time = nowt
 
-                if self.stable_gesture and self.stable_count >= self.stable_required:
-                    gesture_to_send = self.stable_gesture
+                # Prefer directional if present
+                if directional:
+                    # To avoid flicker, only accept if enough time passed or it changed
+                    gesture_to_send = directional
                 else:
-                    gesture_to_send = None
-
-            # Send gesture command over UDP if enabled
-            if gesture_to_send:
-                # Apply per-command cooldowns for non-directional gestures
-                if gesture_to_send in ("select", "confirm", "cancel"):
-                    tnow = time.time()
-                    last_t = self._last_cmd_time.get(gesture_to_send, 0)
-                    min_gap = self._cooldowns.get(gesture_to_send, 0.6)
-                    if (tnow - last_t) >= min_gap:
+                    # Require stability for non-directional gestures
+                    if gesture_candidate == self.stable_gesture:
+                        self.stable_count += 1
+                    else:
+                        self.stable_gesture = gesture_candidate
+                        self.stable_count = 1
+
+                    if self.stable_gesture and self.stable_count >= self.stable_required:
+                        gesture_to_send = self.stable_gesture
+                    else:
+                        gesture_to_send = None
+
+                # Send gesture command over UDP if enabled
+                if gesture_to_send:
+                    # Apply per-command cooldowns for non-directional gestures
+                    if gesture_to_send in ("select", "confirm", "cancel"):
+                        tnow = time.monotonic()
+                        last_t = self._last_cmd_time.get(gesture_to_send, 0)
+                        min_gap = self._cooldowns.get(gesture_to_send, 0.6)
+                        if (tnow - last_t) >= min_gap:
+                            self._send_udp_command(gesture_to_send)
+                            self._last_cmd_time[gesture_to_send] = tnow
+                            # Require gesture to leave pose before re-arming
+                            self.stable_gesture = None
+                            self.stable_count = 0
+                    else:
+                        # Send directional commands immediately
                         self._send_udp_command(gesture_to_send)
-                        self._last_cmd_time[gesture_to_send] = tnow
-                        # Require gesture to leave pose before re-arming
-                        self.stable_gesture = None
-                        self.stable_count = 0
-                else:
-                    # Send directional commands immediately
-                    self._send_udp_command(gesture_to_send)
+
+            # Draw grid overlay and highlight the current tile for user clarity
+            self._draw_board_overlay(frame, self._last_cursor_tile)
         
         # Draw the volume bar only if feature is enabled
         if self.volume_enabled:
             self._draw_volume_indicator(frame, self.current_volume_level)
         
         # Keep UI minimal: no gesture label or ACK text
-        # Calculate FPS for monitoring
-        current_time = time.time()
-        if self.last_frame_time > 0:
-            self.frame_rate = 1.0 / (current_time - self.last_frame_time)
-        self.last_frame_time = current_time
+        # Calculate FPS for monitoring (averaged over the ring buffer)
+        self._frame_times.append(time.monotonic_ns())
+        self._frame_tick += 1
+        if self._frame_tick % 15 == 0 and len(self._frame_times) > 1:
+            elapsed_ns = self._frame_times[-1] - self._frame_times[0]
+            if elapsed_ns > 0:
+                self._fps_text = f"FPS: {1e9 * (len(self._frame_times) - 1) / elapsed_ns:.1f}"
         
         # Draw UI text
         self._draw_ui_text(frame, finger_distance, target_volume)
@@ -581,105 +904,174 @@ class HandGestureVolumeControl:
         if not self.udp_enabled or not self.udp_sock:
             return
 
-        now = time.time()
-        # Avoid sending duplicates too rapidly
-        if cmd == self._last_sent_command and (now - self._last_sent_time) < self._send_interval:
-            return
-
-        if (now - self._last_sent_time) < 0.02:
-            # global minimum spacing
+        now = time.monotonic()
+        # Avoid sending duplicates too rapidly, and keep a global minimum spacing
+        since_last = now - self._last_sent_time
+        if since_last < self._global_min_gap or (cmd == self._last_sent_command and since_last < self._send_interval):
             return
 
         try:
-            # Send command
-            self.udp_sock.sendto(cmd.encode('utf-8'), (self.udp_host, int(self.udp_port)))
+            # Hand off to the sender thread; the vision loop never touches the socket
+            self._udp_queue.put_nowait(cmd)
             self._last_sent_command = cmd
             self._last_sent_time = now
-            if self.show_debug_info:
-                print(f"Sent gesture command: {cmd}")
-
-            # Try to read a short ACK back (non-blocking). Wait briefly using select.
+        except queue.Full:
+            pass
+    
+    def _udp_sender_loop(self):
+        """Drain queued gesture commands and send them over UDP (runs in thread)"""
+        while self.running and self.udp_sock is not None:
             try:
-                import select as _sel
-                r, _, _ = _sel.select([self.udp_sock], [], [], 0.03)
-                if r:
-                    data, addr = self.udp_sock.recvfrom(256)
-                    text = data.decode('utf-8', errors='ignore')
-                    if text.startswith('ACK:'):
-                        ack_cmd = text.split(':', 1)[1]
-                        self.last_ack = (ack_cmd, time.time())
-                        if self.show_debug_info:
-                            print(f"Received ACK: {ack_cmd} from {addr}")
-            except Exception:
+                cmd = self._udp_queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+            try:
+                payload = self._cmd_bytes_cache.get(cmd)
+                if payload is None:
+                    payload = self._cmd_bytes_cache[cmd] = cmd.encode('utf-8')
+                self.udp_sock.sendto(payload, self._udp_addr)
+                if self.show_debug_info:
+                    log.debug("Sent gesture command: %s", cmd)
+            except BlockingIOError:
+                # Non-blocking; drop if socket would block
                 pass
-        except BlockingIOError:
-            # Non-blocking; ignore if socket would block
-            pass
-        except Exception as e:
-            print(f"Failed to send UDP command '{cmd}': {e}")
+            except Exception as e:
+                self._warn_once("udp_send", f"Failed to send UDP command '{cmd}': {e}")
+    
+    def _ack_loop(self):
+        """Read ACKs from the game on a background thread so sends never wait for replies"""
+        while self.running and self.udp_sock is not None:
+            try:
+                # The socket stays non-blocking for sends; wait for replies here instead
+                readable, _, _ = select.select([self.udp_sock], [], [], 0.5)
+                if not readable:
+                    continue
+                data, addr = self.udp_sock.recvfrom(256)
+            except (BlockingIOError, InterruptedError):
+                continue
+            except OSError:
+                # Not bound yet (nothing sent) or the socket was closed
+                time.sleep(0.1)
+                continue
+            text = data.decode('utf-8', errors='ignore')
+            if text.startswith('ACK:'):
+                ack_cmd = text.split(':', 1)[1]
+                self.last_ack = (ack_cmd, time.monotonic())  # single tuple assignment, safe to read from any thread
+                if self.show_debug_info:
+                    log.debug("Received ACK: %s from %s", ack_cmd, addr)
     
     def _draw_ui_text(self, frame, finger_distance: float, target_volume: float):
         """Draw all UI text with bold red highlight and outlines"""
-        outline = (0, 0, 0)
-        fill = (20, 20, 255)  # bright red
-        font = cv2.FONT_HERSHEY_DUPLEX
-
-        if self.show_debug_info:
-            # FPS top-right (keep)
-            pos = (frame.shape[1] - 90, 26)
-            cv2.putText(frame, f'FPS: {int(self.frame_rate)}', pos, font, 0.7, outline, 3)
-            cv2.putText(frame, f'FPS: {int(self.frame_rate)}', pos, font, 0.7, fill, 1)
+        if self.show_debug_info and self._fps_text:
+            # FPS top-right (keep); re-rendered only when the text changes (every 15 frames at most)
+            if self._fps_stamp_text != self._fps_text:
+                self._fps_stamp = self._render_label(self._fps_text, fill=(20, 20, 255))  # bright red
+                self._fps_stamp_text = self._fps_text
+            self._blit_stamp(frame, self._fps_stamp, frame.shape[1] - 110, 26)
 
     # Minimal HUD: no orientation text
     
     def _handle_keyboard_input(self, key: int) -> bool:
         """Handle keyboard input, return False to quit"""
-        if key == ord('q') or key == 27:  # 'q' or ESC
-            return False
-        elif key == ord('r'):
-            # Reset to current system volume
-            self.current_volume_level = self._get_system_volume()
-            print(f"Volume reset to system level: {int(self.current_volume_level)}%")
-        elif key == ord('d'):
-            # Toggle debug info
-            self.show_debug_info = not self.show_debug_info
-            print(f"Debug info: {'ON' if self.show_debug_info else 'OFF'}")
-        elif key == ord('c'):
-            # Calibrate (simplified for threaded use)
-            print("Calibration: Put fingers close together and press 'S'")
-            print("Then put fingers far apart and press 'L'")
-        elif key == ord('s'):
-            # Quick calibration - set minimum
-            print(f"Minimum distance set to current distance")
-        elif key == ord('l'):
-            # Quick calibration - set maximum
-            print(f"Maximum distance set to current distance")
-        elif key == ord('u'):
-            # Toggle UDP sending
-            self.udp_enabled = not self.udp_enabled
-            print(f"UDP sending: {'ON' if self.udp_enabled else 'OFF'}")
-        elif key == ord('v'):
-            # Toggle volume control feature on/off
-            self.volume_enabled = not self.volume_enabled
-            print(f"Volume control: {'ON' if self.volume_enabled else 'OFF'}")
-        elif key == ord('['):
-            self.move_threshold = max(10, self.move_threshold - 5)
-            print(f"Move threshold: {self.move_threshold}")
-        elif key == ord(']'):
-            self.move_threshold = min(200, self.move_threshold + 5)
-            print(f"Move threshold: {self.move_threshold}")
-        elif key == ord('m'):
-            # Toggle horizontal mirror
-            self.mirror_x = not self.mirror_x
-            print(f"MirrorX: {'ON' if self.mirror_x else 'OFF'}")
-        elif key == ord('f'):
-            # Toggle vertical flip
-            self.flip_y = not self.flip_y
-            print(f"FlipY: {'ON' if self.flip_y else 'OFF'}")
-        # Note: No runtime window resize hotkeys to avoid accidental changes
-        
+        handler = self._key_actions.get(key)
+        return handler() if handler else True
+    
+    def _key_quit(self) -> bool:
+        return False
+    
+    def _key_reset_volume(self) -> bool:
+        # Reset to current system volume
+        self.current_volume_level = self._get_system_volume()
+        print(f"Volume reset to system level: {int(self.current_volume_level)}%")
+        return True
+    
+    def _key_toggle_debug(self) -> bool:
+        self.show_debug_info = not self.show_debug_info
+        print(f"Debug info: {'ON' if self.show_debug_info else 'OFF'}")
+        return True
+    
+    def _key_calibrate(self) -> bool:
+        # Calibrate (simplified for threaded use)
+        print("Calibration: Put fingers close together and press 'S'")
+        print("Then put fingers far apart and press 'L'")
+        return True
+    
+    def _key_set_minimum(self) -> bool:
+        # Quick calibration - set minimum
+        print(f"Minimum distance set to current distance")
+        return True
+    
+    def _key_set_maximum(self) -> bool:
+        # Quick calibration - set maximum
+        print(f"Maximum distance set to current distance")
+        return True
+    
+    def _key_toggle_udp(self) -> bool:
+        self.udp_enabled = not self.udp_enabled
+        print(f"UDP sending: {'ON' if self.udp_enabled else 'OFF'}")
+        return True
+    
+    def _key_toggle_volume(self) -> bool:
+        # Toggle volume control feature on/off
+        self.volume_enabled = not self.volume_enabled
+        print(f"Volume control: {'ON' if self.volume_enabled else 'OFF'}")
+        return True
+    
+    def _key_decrease_threshold(self) -> bool:
+        self.move_threshold = max(10, self.move_threshold - 5)
+        print(f"Move threshold: {self.move_threshold}")
+        return True
+    
+    def _key_increase_threshold(self) -> bool:
+        self.move_threshold = min(200, self.move_threshold + 5)
+        print(f"Move threshold: {self.move_threshold}")
+        return True
+    
+    def _key_toggle_mirror(self) -> bool:
+        # Toggle horizontal mirror
+        self.mirror_x = not self.mirror_x
+        print(f"MirrorX: {'ON' if self.mirror_x else 'OFF'}")
+        return True
+    
+    def _key_toggle_flip(self) -> bool:
+        # Toggle vertical flip
+        self.flip_y = not self.flip_y
+        print(f"FlipY: {'ON' if self.flip_y else 'OFF'}")
         return True
     
+    def _fit_to_window(self, frame):
+        """Return the frame at window size, resizing into the reused display buffer only when needed"""
+        if frame.shape[1] == self.window_width and frame.shape[0] == self.window_height:
+            return frame
+        return cv2.resize(frame, (self.window_width, self.window_height), dst=self._display_buf,
+                          interpolation=cv2.INTER_NEAREST)
+    
+    def _pin_to_core(self):
+        """Best-effort: pin the calling thread to the last CPU core, away from the game's render thread.
+
+        Affinity and niceness are per-thread here and threads started afterwards inherit the
+        affinity, so call this last in loop setup, after the helper threads are running.
+        """
+        cpu_count = os.cpu_count() or 1
+        if cpu_count < 2:
+            return
+        last_core = cpu_count - 1
+        try:
+            if hasattr(os, "sched_setaffinity"):  # Linux: pid 0 is the calling thread
+                os.sched_setaffinity(0, {last_core})
+                try:
+                    os.nice(-5)  # only this thread on Linux; needs privileges, harmless if refused
+                except OSError:
+                    pass
+            elif current_os == "Windows":
+                import ctypes
+                kernel32 = ctypes.windll.kernel32
+                thread_handle = kernel32.GetCurrentThread()
+                kernel32.SetThreadAffinityMask(thread_handle, 1 << last_core)
+                kernel32.SetThreadPriority(thread_handle, 1)  # THREAD_PRIORITY_ABOVE_NORMAL
+        except (AttributeError, OSError):
+            pass
+    
     def _gesture_control_loop(self):
         """Main loop that processes video and controls volume (runs in thread)"""
         if self.camera is None:
@@ -689,6 +1081,29 @@ class HandGestureVolumeControl:
         print("Hand gesture volume control started")
         print("Controls: Pinch thumb/index to change volume | Q=quit | D=toggle debug | R=reset")
         
+        # Audio stack calls can take several ms, so they run on their own thread
+        if self._volume_thread is None or not self._volume_thread.is_alive():
+            self._volume_thread = threading.Thread(target=self._volume_worker, daemon=True)
+            self._volume_thread.start()
+        
+        # ACKs from the game are collected off the video loop
+        if self.udp_sock is not None and (self._ack_thread is None or not self._ack_thread.is_alive()):
+            self._ack_thread = threading.Thread(target=self._ack_loop, daemon=True)
+            self._ack_thread.start()
+        
+        # UDP sends also leave the video loop so socket pressure can't stall a frame
+        if self.udp_sock is not None and (self._sender_thread is None or not self._sender_thread.is_alive()):
+            self._sender_thread = threading.Thread(target=self._udp_sender_loop, daemon=True)
+            self._sender_thread.start()
+        
+        # Camera reads block on the driver, so they happen on a reader thread
+        if self._reader_thread is None or not self._reader_thread.is_alive():
+            self._reader_thread = threading.Thread(target=self._reader_loop, daemon=True)
+            self._reader_thread.start()
+        
+        # Pin only after the helpers are running so they don't inherit this core
+        self._pin_to_core()
+        
         # Force create window for visual feedback (we want to see both windows)
         create_window = True
         window_created = False
@@ -716,6 +1131,9 @@ class HandGestureVolumeControl:
                     print("Warning: Running without visual feedback window")
                     create_window = False
         
+        # pollKey (OpenCV >= 4.5) pumps window events without waitKey's fixed 1 ms sleep
+        poll_key = getattr(cv2, 'pollKey', None) or (lambda: cv2.waitKey(1))
+        
         while self.running:
             # Process any commands from the main thread
             try:
@@ -733,20 +1151,15 @@ class HandGestureVolumeControl:
             if create_window and window_created:
                 try:
                     # Always show a fixed-size frame so the window never changes size
-                    frame_to_show = cv2.resize(frame, (self.window_width, self.window_height), interpolation=cv2.INTER_LINEAR)
-                    # Re-assert non-fullscreen state to prevent accidental maximization
-                    try:
-                        cv2.setWindowProperty(self.window_name, cv2.WND_PROP_FULLSCREEN, cv2.WINDOW_NORMAL)
-                    except Exception:
-                        pass
+                    frame_to_show = self._fit_to_window(frame)
                     cv2.imshow(self.window_name, frame_to_show)
-                    key_pressed = cv2.waitKey(1) & 0xFF
+                    key_pressed = poll_key() & 0xFF
                     if key_pressed != 255:  # A key was pressed
                         if not self._handle_keyboard_input(key_pressed):
                             break
                 except Exception as e:
                     # If display fails, try to recreate window once
-                    print(f"Display error: {e}")
+                    self._warn_once("display", f"Display error: {e}")
                     try:
                         cv2.destroyWindow(self.window_name)
                         cv2.namedWindow(self.window_name, cv2.WINDOW_AUTOSIZE)
@@ -755,16 +1168,16 @@ class HandGestureVolumeControl:
                         except Exception:
                             pass
                         cv2.moveWindow(self.window_name, 100, 100)
-                        frame_to_show = cv2.resize(frame, (self.window_width, self.window_height), interpolation=cv2.INTER_LINEAR)
+                        frame_to_show = self._fit_to_window(frame)
                         cv2.imshow(self.window_name, frame_to_show)
                     except:
-                        print("Could not recreate window, continuing without visual feedback")
+                        log.warning("Could not recreate window, continuing without visual feedback")
                         create_window = False
-            else:
-                # Small delay to prevent excessive CPU usage when running without display
-                time.sleep(0.033)  # ~30 FPS equivalent
+            # Without a window the loop is paced by the frame queue, which blocks until the next frame
         
         self.running = False
+        if self._reader_thread is not None and self._reader_thread is not threading.current_thread():
+            self._reader_thread.join(timeout=1.0)
         if create_window and window_created:
             try:
                 cv2.destroyWindow(self.window_name)
@@ -815,10 +1228,20 @@ class HandGestureVolumeControl:
             self.cleanup()
     
     def cleanup(self):
-        """Clean up camera and windows"""
+        """Clean up camera, hand tracker and windows (safe to call more than once)"""
         self.running = False
         if self.camera:
-            self.camera.release()
+            self.camera.release()  # releasing twice is a no-op
+        # Hands is built once in __init__; closing it frees the model's tensor arenas
+        if getattr(self, "hands", None) is not None:
+            try:
+                self.hands.close()
+            except Exception as e:
+                print(f"Error closing hand tracker: {e}")
+            self.hands = None
+        if getattr(self, "_pulse", None) is not None:
+            self._pulse.close()
+            self._pulse = None
         cv2.destroyAllWindows()
         print("Gesture control cleanup complete")
     
@@ -837,6 +1260,12 @@ def main():
     parser.add_argument("--no-volume", action="store_true", help="Disable volume changes (visual only)")
     parser.add_argument("--no-mirror", action="store_true", help="Disable horizontal mirror (selfie) so left/right are not flipped")
     parser.add_argument("--flip-vertical", action="store_true", help="Flip the camera vertically to match board orientation")
+    parser.add_argument("--model-complexity", type=int, choices=[0, 1], default=0, help="Hand landmark model: 0 = lite/fast (default), 1 = full")
+    parser.add_argument("--target-fps", type=float, default=20, help="Frames decoded and processed per second (default 20)")
+    parser.add_argument("--inference-width", type=int, default=256, help="Width frames are downscaled to before hand tracking (default 256)")
+    parser.add_argument("--infer-every", type=int, default=2, help="Run hand tracking every Nth frame while a hand is tracked (default 2)")
+    parser.add_argument("--cv-threads", type=int, default=1, help="OpenCV worker threads (default 1)")
+    parser.add_argument("--opencl", action="store_true", help="Let OpenCV use OpenCL (off by default)")
     args = parser.parse_args()
 
     print("Hand Gesture Volume Control for Chess Game")
@@ -850,7 +1279,13 @@ def main():
                                                   udp_host=args.udp_host,
                                                   udp_port=args.udp_port,
                                                   mirror_x=(not args.no_mirror),
-                                                  flip_y=args.flip_vertical)
+                                                  flip_y=args.flip_vertical,
+                                                  model_complexity=args.model_complexity,
+                                                  target_fps=args.target_fps,
+                                                  inference_width=args.inference_width,
+                                                  infer_every=args.infer_every,
+                                                  cv_threads=args.cv_threads,
+                                                  use_opencl=args.opencl)
     # If volume disabled, set smoothing to 0 so _change_system_volume throttles itself effectively
     if args.no_volume:
         gesture_controller.smoothing_factor = 0.0
@@ -18,6 +18,7 @@ Options:
 
 import sys
 import argparse
+import importlib.util
 import threading
 import time
 import signal
@@ -27,16 +28,12 @@ def check_dependencies():
     """Check if all required packages are installed"""
     missing_packages = []
     
-    try:
-        import pygame
-    except ImportError:
+    # find_spec only locates the packages; nothing is imported (cv2/mediapipe take
+    # a second or more to load) until the chosen mode actually needs it
+    if importlib.util.find_spec("pygame") is None:
         missing_packages.append("pygame")
     
-    try:
-        import cv2
-        import mediapipe
-        import numpy
-    except ImportError as e:
+    if any(importlib.util.find_spec(name) is None for name in ("cv2", "mediapipe", "numpy")):
         missing_packages.append("opencv-python, mediapipe, numpy")
     
     if missing_packages:
@@ -9,75 +9,197 @@ import threading
 import socket
 import select
 import math
+import queue
+import numpy as np
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pygame.locals import *
 
-from constants import FPS, WIDTH
-from models import ChessGame # Ensure ChessGame.copy() is implemented here
+from constants import FPS, MENU_FPS, BOARD_RECT, SQUARE_SIZE, PANEL_BG, MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT
+from models import ChessGame
 from ui import draw_board, draw_sidebar, draw_score_screen
-from utils import setup_window, create_piece_surfaces, initialize_sounds
-from ai import ChessAI
+from utils import setup_window, create_piece_surfaces, initialize_sounds, create_gradient_surface, blit_batch, get_sys_font, run_maybe_profiled
+from ai import ChessAI, search_best_move, warm_up_search
 
-def draw_mode_selection(window, font):
+# Static layers of the mode selection screen, rendered once and reused every frame
+_mode_background_cache = {}  # window size -> Surface
+_button_face_cache = {}  # (size, colors, text, description, hover) -> fully drawn button Surface
+_button_shadow_cache = {}  # (width, height, alpha) -> Surface
+_menu_text_cache = {}  # (font key, text, color) -> rendered Surface
+_corner_piece_cache = {}  # image file -> 80x80 Surface, or None if it could not be loaded
+_piece_glow_cache = {}  # (width, height) -> glow ellipse Surface
+_mode_screen_state = {"key": None}  # window size + hovered button of the last presented frame
+
+# Mode buttons share x position and size and are stacked vertically
+MODE_BUTTON_WIDTH, MODE_BUTTON_HEIGHT = 380, 90
+MODE_BUTTON_TOP = 220
+MODE_BUTTON_PITCH = MODE_BUTTON_HEIGHT + 40  # button height + spacing
+MODE_BUTTON_COUNT = 2  # 0 = Player vs Player, 1 = Player vs Computer
+
+# Sine lookup table for the menu animations (a plain list: indexing it is cheaper than math.sin)
+_SIN_LUT_SIZE = 1024
+_SIN_LUT = np.sin(np.linspace(0, 2 * math.pi, _SIN_LUT_SIZE, endpoint=False)).tolist()
+_SIN_LUT_SCALE = _SIN_LUT_SIZE / (2 * math.pi)
+
+def _fast_sin(phase):
+    """Table lookup approximation of math.sin, good enough for decorative motion"""
+    return _SIN_LUT[int(phase * _SIN_LUT_SCALE) & (_SIN_LUT_SIZE - 1)]
+
+def _fast_cos(phase):
+    return _fast_sin(phase + math.pi / 2)
+
+def _mode_button_at(pos, center_x):
+    """Index of the mode button under pos, or -1; same edges as Rect.collidepoint"""
+    x, y = pos
+    if not 0 <= x - (center_x - MODE_BUTTON_WIDTH // 2) < MODE_BUTTON_WIDTH:
+        return -1
+    index, offset = divmod(y - MODE_BUTTON_TOP, MODE_BUTTON_PITCH)
+    return index if 0 <= index < MODE_BUTTON_COUNT and offset < MODE_BUTTON_HEIGHT else -1
+
+def _render_menu_text(name, size, bold, text, color):
+    """Render a static menu string once and reuse the Surface (in the display's alpha format)"""
+    key = (name, size, bold, text, color)
+    surface = _menu_text_cache.get(key)
+    if surface is None:
+        surface = get_sys_font(name, size, bold).render(text, True, color).convert_alpha()
+        _menu_text_cache[key] = surface
+    return surface
+
+def _draw_thinking_indicator(window, frame):
+    """Draw the cached "AI is thinking" label (frame 0-3 = number of trailing dots) under the turn box"""
+    full = _render_menu_text("segoeui", 16, True, "AI is thinking...", (255, 255, 0))
+    label = _render_menu_text("segoeui", 16, True, "AI is thinking" + "." * frame, (255, 255, 0))
+    # Anchor on the widest frame so the text does not shift as the dots grow
+    window.blit(label, (window.get_width() - 20 - full.get_width(), 145))
+
+def _get_mode_background(size):
+    """Return the background gradient for the mode selection screen (cached per window size)"""
+    background = _mode_background_cache.get(size)
+    if background is None:
+        width, height = size
+        background = pygame.Surface(size).convert()
+        # The gradient used to shimmer by +/-0.1 around alpha 0.3 (a shift of a few color
+        # levels at most); it is frozen at the midpoint so it can be drawn once
+        alpha = 0.3
+        gradient_intensity = np.arange(height)[:, None] / height
+        base = np.array([15, 23, 42])
+        top = np.array([35, 45, 75])
+        column = (base + (top - base) * gradient_intensity * alpha).astype(np.uint8)  # (H, 3)
+        # surfarray is indexed [x, y], so repeat the column across the width
+        pygame.surfarray.blit_array(background, np.broadcast_to(column[None, :, :], (width, height, 3)))
+        _mode_background_cache.clear()  # only the current window size is worth keeping
+        _mode_background_cache[size] = background
+    return background
+
+# Corner decorations: top-left Black Queen, top-right White King, bottom-left Black King, bottom-right White Queen
+CORNER_PIECE_FILES = [
+    "Images/Black Pieces/queen.png",
+    "Images/White Pieces/King(1).png",
+    "Images/Black Pieces/king.png",
+    "Images/White Pieces/Queen(1).png"
+]
+
+def _get_corner_pieces():
+    """Return the corner piece images, loading and scaling each file only the first time"""
+    for piece_file in CORNER_PIECE_FILES:
+        if piece_file in _corner_piece_cache:
+            continue
+        try:
+            piece_img = pygame.image.load(piece_file)
+            # Scale down for corner decoration (80x80 pixels)
+            piece_img = pygame.transform.smoothscale(piece_img, (80, 80))
+            # Convert with alpha to preserve transparency
+            _corner_piece_cache[piece_file] = piece_img.convert_alpha()
+        except Exception as e:
+            print(f"Could not load piece image {piece_file}: {e}")
+            # Fallback to None, will use text pieces
+            _corner_piece_cache[piece_file] = None
+    return [_corner_piece_cache[piece_file] for piece_file in CORNER_PIECE_FILES]
+
+def _get_piece_glow(width, height):
+    """Return the soft ellipse drawn behind a corner piece (cached per size)"""
+    key = (width, height)
+    glow = _piece_glow_cache.get(key)
+    if glow is None:
+        glow = pygame.Surface((width, height), pygame.SRCALPHA)
+        glow_color = (100, 120, 160, 30)  # Subtle blue glow with transparency
+        pygame.draw.ellipse(glow, glow_color, glow.get_rect())
+        glow = _piece_glow_cache[key] = glow.convert_alpha()
+    return glow
+
+def _get_button_shadow(width, height, alpha):
+    """Return the rounded drop shadow for a button (cached per size and alpha)"""
+    key = (width, height, alpha)
+    shadow = _button_shadow_cache.get(key)
+    if shadow is None:
+        shadow = pygame.Surface((width, height), pygame.SRCALPHA)
+        pygame.draw.rect(shadow, (0, 0, 0, alpha), shadow.get_rect(), border_radius=15)
+        shadow = _button_shadow_cache[key] = shadow.convert_alpha()
+    return shadow
+
+def _get_button_face(width, height, primary_color, secondary_color, text, description, is_hover):
+    """Rasterize a mode button (gradient, border, highlight and text) once per size and hover state"""
+    key = (width, height, primary_color, secondary_color, text, description, is_hover)
+    face = _button_face_cache.get(key)
+    if face is None:
+        face = create_gradient_surface(width, height, primary_color, secondary_color).convert()
+        
+        # Border with glow effect
+        border_color = (255, 255, 255, 150) if is_hover else (200, 200, 200, 100)
+        pygame.draw.rect(face, border_color[:3], face.get_rect(), width=2, border_radius=15)
+        
+        # Inner highlight
+        highlight_surf = pygame.Surface((width - 4, height // 3), pygame.SRCALPHA)
+        pygame.draw.rect(highlight_surf, (255, 255, 255, 30), highlight_surf.get_rect(), border_radius=12)
+        face.blit(highlight_surf, (2, 2))
+        
+        # Button text with shadow
+        text_surface = _render_menu_text("segoeui", 28, True, text, (255, 255, 255))
+        text_x = width // 2 - text_surface.get_width() // 2
+        text_y = height // 2 - text_surface.get_height() // 2 - 8
+        face.blit(_render_menu_text("segoeui", 28, True, text, (0, 0, 0)), (text_x + 1, text_y + 1))
+        face.blit(text_surface, (text_x, text_y))
+        
+        # Description text
+        desc_surface = _render_menu_text("segoeui", 16, False, description, (200, 210, 220))
+        face.blit(desc_surface, (width // 2 - desc_surface.get_width() // 2, text_y + text_surface.get_height() + 5))
+        
+        _button_face_cache[key] = face
+    return face
+
+def draw_mode_selection(window):
     """Draw a sophisticated and modern game mode selection screen"""
-    # Rich dark background with subtle pattern
-    window.fill((15, 23, 42))  # Deep navy blue
-    
-    # Create a subtle geometric pattern background
-    pattern_color = (25, 35, 55)
-    for x in range(0, window.get_width(), 60):
-        for y in range(0, window.get_height(), 60):
-            if (x // 60 + y // 60) % 2 == 0:
-                pygame.draw.rect(window, pattern_color, (x, y, 30, 30))
-    
-    # Animated gradient overlay
+    # Cached layers (background, text, buttons, footer) are collected and blitted in one batch;
+    # they don't overlap the animated pieces and sparkles drawn afterwards
+    # Rich dark background with a vertical gradient (pre-rendered)
+    static_blits = [(_get_mode_background(window.get_size()), (0, 0))]
     time_offset = pygame.time.get_ticks() * 0.001
-    for y in range(window.get_height()):
-        alpha = 0.3 + 0.1 * math.sin(time_offset + y * 0.01)
-        gradient_intensity = y / window.get_height()
-        color = (
-            int(15 + (35 - 15) * gradient_intensity * alpha),
-            int(23 + (45 - 23) * gradient_intensity * alpha), 
-            int(42 + (75 - 42) * gradient_intensity * alpha)
-        )
-        pygame.draw.line(window, color, (0, y), (window.get_width(), y))
-    
-    # Elegant typography
-    title_font = pygame.font.SysFont("georgia", 72, bold=True)  # Serif font for elegance
-    subtitle_font = pygame.font.SysFont("segoeui", 24)
-    button_font = pygame.font.SysFont("segoeui", 28, bold=True)
     
+    # Elegant typography (serif title); all static text is rendered once and cached
     # Main title with shadow effect
     title_text = "Chess Game"
-    title_shadow = title_font.render(title_text, True, (0, 0, 0))
-    title_surface = title_font.render(title_text, True, (220, 220, 235))
+    title_shadow = _render_menu_text("georgia", 72, True, title_text, (0, 0, 0))
+    title_surface = _render_menu_text("georgia", 72, True, title_text, (220, 220, 235))
     
     title_x = window.get_width() // 2 - title_surface.get_width() // 2
-    window.blit(title_shadow, (title_x + 3, 63))  # Shadow offset
-    window.blit(title_surface, (title_x, 60))
+    static_blits.append((title_shadow, (title_x + 3, 63)))  # Shadow offset
+    static_blits.append((title_surface, (title_x, 60)))
     
     # Elegant subtitle
     subtitle_text = "Choose Your Battle"
-    subtitle_surface = subtitle_font.render(subtitle_text, True, (160, 170, 190))
+    subtitle_surface = _render_menu_text("segoeui", 24, False, subtitle_text, (160, 170, 190))
     subtitle_x = window.get_width() // 2 - subtitle_surface.get_width() // 2
-    window.blit(subtitle_surface, (subtitle_x, 140))
-    
-    # Decorative line under title
-    line_width = 200
-    line_x = window.get_width() // 2 - line_width // 2
-    pygame.draw.rect(window, (100, 120, 150), (line_x, 170, line_width, 2))
+    static_blits.append((subtitle_surface, (subtitle_x, 140)))
     
     # Modern button design
-    btn_width, btn_height = 380, 90
     center_x = window.get_width() // 2
-    spacing = 40
-    
-    btn_classic = pygame.Rect(center_x - btn_width // 2, 220, btn_width, btn_height)
-    btn_ai = pygame.Rect(center_x - btn_width // 2, 220 + btn_height + spacing, btn_width, btn_height)
-    mouse_pos = pygame.mouse.get_pos()
+    btn_x = center_x - MODE_BUTTON_WIDTH // 2
+    btn_classic = pygame.Rect(btn_x, MODE_BUTTON_TOP, MODE_BUTTON_WIDTH, MODE_BUTTON_HEIGHT)
+    btn_ai = pygame.Rect(btn_x, MODE_BUTTON_TOP + MODE_BUTTON_PITCH, MODE_BUTTON_WIDTH, MODE_BUTTON_HEIGHT)
+    hovered = _mode_button_at(pygame.mouse.get_pos(), center_x)
 
-    def draw_modern_button(rect, primary_color, secondary_color, text, description):
-        is_hover = rect.collidepoint(mouse_pos)
-        
+    def draw_modern_button(rect, is_hover, primary_color, secondary_color, text, description):
         # Hover animation effect
         hover_scale = 1.05 if is_hover else 1.0
         hover_offset = -2 if is_hover else 0
@@ -93,155 +215,136 @@ def draw_mode_selection(window, font):
         shadow_offset = 8 if is_hover else 5
         shadow_alpha = 80 if is_hover else 50
         shadow_rect = scaled_rect.move(shadow_offset, shadow_offset)
-        shadow_surf = pygame.Surface((scaled_rect.width, scaled_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(shadow_surf, (0, 0, 0, shadow_alpha), shadow_surf.get_rect(), border_radius=15)
-        window.blit(shadow_surf, shadow_rect)
-        
-        # Gradient background
-        for i in range(scaled_rect.height):
-            gradient_ratio = i / scaled_rect.height
-            color = (
-                int(primary_color[0] * (1 - gradient_ratio) + secondary_color[0] * gradient_ratio),
-                int(primary_color[1] * (1 - gradient_ratio) + secondary_color[1] * gradient_ratio),
-                int(primary_color[2] * (1 - gradient_ratio) + secondary_color[2] * gradient_ratio)
-            )
-            pygame.draw.line(window, color, 
-                           (scaled_rect.x, scaled_rect.y + i), 
-                           (scaled_rect.right, scaled_rect.y + i))
+        static_blits.append((_get_button_shadow(scaled_rect.width, scaled_rect.height, shadow_alpha), shadow_rect))
         
-        # Border with glow effect
-        border_color = (255, 255, 255, 150) if is_hover else (200, 200, 200, 100)
-        pygame.draw.rect(window, border_color[:3], scaled_rect, width=2, border_radius=15)
-        
-        # Inner highlight
-        highlight_rect = pygame.Rect(scaled_rect.x + 2, scaled_rect.y + 2, 
-                                   scaled_rect.width - 4, scaled_rect.height // 3)
-        highlight_surf = pygame.Surface((highlight_rect.width, highlight_rect.height), pygame.SRCALPHA)
-        pygame.draw.rect(highlight_surf, (255, 255, 255, 30), highlight_surf.get_rect(), border_radius=12)
-        window.blit(highlight_surf, highlight_rect)
-        
-        # Button text
-        text_surface = button_font.render(text, True, (255, 255, 255))
-        text_x = scaled_rect.centerx - text_surface.get_width() // 2
-        text_y = scaled_rect.centery - text_surface.get_height() // 2 - 8
-        
-        # Text shadow
-        text_shadow = button_font.render(text, True, (0, 0, 0))
-        window.blit(text_shadow, (text_x + 1, text_y + 1))
-        window.blit(text_surface, (text_x, text_y))
-        
-        # Description text
-        desc_font = pygame.font.SysFont("segoeui", 16)
-        desc_surface = desc_font.render(description, True, (200, 210, 220))
-        desc_x = scaled_rect.centerx - desc_surface.get_width() // 2
-        desc_y = text_y + text_surface.get_height() + 5
-        window.blit(desc_surface, (desc_x, desc_y))
+        # Gradient, border, highlight and text are pre-rendered for each hover state
+        static_blits.append((_get_button_face(scaled_rect.width, scaled_rect.height, primary_color, secondary_color,
+                                              text, description, is_hover), scaled_rect.topleft))
     
     # Draw buttons with sophisticated styling
-    draw_modern_button(btn_classic, (45, 85, 155), (25, 65, 135), 
+    draw_modern_button(btn_classic, hovered == 0, (45, 85, 155), (25, 65, 135), 
                       "Player vs Player", "Challenge a friend in classic chess")
     
-    draw_modern_button(btn_ai, (155, 85, 45), (135, 65, 25), 
+    draw_modern_button(btn_ai, hovered == 1, (155, 85, 45), (135, 65, 25), 
                       "Player vs Computer", "Test your skills against AI")
     
-    # Decorative chess piece images in corners with gentle animation
-    piece_images = []
-    piece_files = [
-        "Images/Black Pieces/queen.png",      # Top-left: Black Queen
-        "Images/White Pieces/King(1).png",    # Top-right: White King
-        "Images/Black Pieces/king.png",       # Bottom-left: Black King
-        "Images/White Pieces/Queen(1).png"    # Bottom-right: White Queen
-    ]
+    # Subtle footer
+    footer_text = "Use ESC to quit • Classic chess rules apply"
+    footer_surface = _render_menu_text("segoeui", 14, False, footer_text, (80, 90, 110))
+    footer_x = window.get_width() // 2 - footer_surface.get_width() // 2
+    static_blits.append((footer_surface, (footer_x, window.get_height() - 40)))
     
-    # Load and scale the piece images
-    for piece_file in piece_files:
-        try:
-            piece_img = pygame.image.load(piece_file)
-            # Scale down for corner decoration (80x80 pixels)
-            piece_img = pygame.transform.smoothscale(piece_img, (80, 80))
-            # Convert with alpha to preserve transparency
-            piece_img = piece_img.convert_alpha()
-            piece_images.append(piece_img)
-        except Exception as e:
-            print(f"Could not load piece image {piece_file}: {e}")
-            # Fallback to None, will use text pieces
-            piece_images.append(None)
+    blit_batch(window, static_blits)
+    
+    # Decorative line under title
+    line_width = 200
+    line_x = window.get_width() // 2 - line_width // 2
+    pygame.draw.rect(window, (100, 120, 150), (line_x, 170, line_width, 2))
+    
+    # Decorative chess piece images in corners with gentle animation
+    piece_images = _get_corner_pieces()
     
     positions = [(50, 50), (window.get_width() - 130, 50), 
                 (50, window.get_height() - 130), (window.get_width() - 130, window.get_height() - 130)]
     
+    # Corner pieces are collected and blitted in one batch at the end
+    animated_blits = []
+    
     # Gentle floating animation for pieces
-    float_offset = math.sin(time_offset * 2) * 3
+    float_offset = _fast_sin(time_offset * 2) * 3
     
     for i, (piece_img, pos) in enumerate(zip(piece_images, positions)):
         # Each piece has a slightly different animation phase
-        individual_offset = math.sin(time_offset * 2 + i * 0.5) * 2
+        individual_offset = _fast_sin(time_offset * 2 + i * 0.5) * 2
         animated_y = pos[1] + individual_offset
         
         if piece_img is not None:
             # Create a subtle glow effect for the image
-            glow_surf = pygame.Surface((piece_img.get_width() + 10, piece_img.get_height() + 10), pygame.SRCALPHA)
-            glow_color = (100, 120, 160, 30)  # Subtle blue glow with transparency
-            pygame.draw.ellipse(glow_surf, glow_color, glow_surf.get_rect())
+            glow_surf = _get_piece_glow(piece_img.get_width() + 10, piece_img.get_height() + 10)
             
             # Draw glow first (slightly offset)
-            window.blit(glow_surf, (pos[0] - 5, animated_y - 5))
+            animated_blits.append((glow_surf, (pos[0] - 5, animated_y - 5)))
             
             # Draw the actual piece image
-            window.blit(piece_img, (pos[0], animated_y))
+            animated_blits.append((piece_img, (pos[0], animated_y)))
         else:
             # Fallback to text pieces if image loading failed
-            piece_font = pygame.font.SysFont("segoeui", 48)
             fallback_pieces = ["♛", "♔", "♚", "♕"]
             piece_char = fallback_pieces[i]
             
             # Create a subtle glow effect
-            piece_glow = piece_font.render(piece_char, True, (100, 120, 160))
-            piece_surface = piece_font.render(piece_char, True, (60, 80, 120))
+            piece_glow = _render_menu_text("segoeui", 48, False, piece_char, (100, 120, 160))
+            piece_surface = _render_menu_text("segoeui", 48, False, piece_char, (60, 80, 120))
             
             # Draw glow (slightly larger and offset)
-            window.blit(piece_glow, (pos[0] - 1, animated_y - 1))
-            window.blit(piece_surface, (pos[0], animated_y))
+            animated_blits.append((piece_glow, (pos[0] - 1, animated_y - 1)))
+            animated_blits.append((piece_surface, (pos[0], animated_y)))
+    
+    blit_batch(window, animated_blits)
     
     # Add subtle animated sparkles around the title
     sparkle_count = 8
     for i in range(sparkle_count):
         angle = (time_offset + i * (2 * math.pi / sparkle_count)) % (2 * math.pi)
-        radius = 150 + 20 * math.sin(time_offset * 3 + i)
-        sparkle_x = title_x + title_surface.get_width() // 2 + radius * math.cos(angle)
-        sparkle_y = 80 + radius * 0.3 * math.sin(angle)
+        radius = 150 + 20 * _fast_sin(time_offset * 3 + i)
+        sparkle_x = title_x + title_surface.get_width() // 2 + radius * _fast_cos(angle)
+        sparkle_y = 80 + radius * 0.3 * _fast_sin(angle)
         
         # Only draw sparkles that are within reasonable bounds
         if 0 < sparkle_x < window.get_width() and 0 < sparkle_y < window.get_height():
-            sparkle_size = int(2 + math.sin(time_offset * 4 + i) * 1)
-            sparkle_alpha = int(100 + 50 * math.sin(time_offset * 2 + i))
+            sparkle_size = int(2 + _fast_sin(time_offset * 4 + i) * 1)
+            sparkle_alpha = int(100 + 50 * _fast_sin(time_offset * 2 + i))
             sparkle_color = (200, 220, 255, min(255, max(0, sparkle_alpha)))
             
-            sparkle_surf = pygame.Surface((sparkle_size * 2, sparkle_size * 2), pygame.SRCALPHA)
-            pygame.draw.circle(sparkle_surf, sparkle_color[:3], (sparkle_size, sparkle_size), sparkle_size)
-            window.blit(sparkle_surf, (sparkle_x - sparkle_size, sparkle_y - sparkle_size))
+            # Sparkles are opaque dots, so they are drawn straight onto the window
+            pygame.draw.circle(window, sparkle_color[:3], (int(sparkle_x), int(sparkle_y)), sparkle_size)
     
-    # Subtle footer
-    footer_font = pygame.font.SysFont("segoeui", 14)
-    footer_text = "Use ESC to quit • Classic chess rules apply"
-    footer_surface = footer_font.render(footer_text, True, (80, 90, 110))
-    footer_x = window.get_width() // 2 - footer_surface.get_width() // 2
-    window.blit(footer_surface, (footer_x, window.get_height() - 40))
-
-    pygame.display.update()
+    # Present the whole window only when the layout or a button's hover state changed;
+    # otherwise only the animated corner pieces and the sparkle band around the title move
+    screen_key = (window.get_size(), hovered)
+    if screen_key != _mode_screen_state["key"]:
+        _mode_screen_state["key"] = screen_key
+        pygame.display.update()
+    else:
+        title_center_x = title_x + title_surface.get_width() // 2
+        animated_rects = [pygame.Rect(title_center_x - 175, 20, 350, 120)]  # sparkle orbit (r <= 170)
+        animated_rects += [pygame.Rect(x - 5, y - 8, 90, 96) for x, y in positions]  # piece + glow + float
+        pygame.display.update(animated_rects)
     return btn_classic, btn_ai
 
 
-# NEW: Function to be run in a separate thread for AI move calculation.
-# This function will post an event back to the main thread when done.
-def ai_move_thread(ai_player, game_copy, ai_move_event):
+def create_ai_pool():
     """
-    Calculates the AI's best move on a copy of the game state
-    and posts an event to the main thread when done.
+    Starts the persistent worker that runs AI searches, so minimax runs outside this
+    process's GIL and never stalls rendering. Falls back to a thread if processes are unavailable.
     """
-    # The AI now works on game_copy, NOT the original 'game' object
-    ai_move = ai_player.get_best_move(game_copy)
-    ai_move_event.post(pygame.event.Event(pygame.USEREVENT + 1, {"ai_move": ai_move}))
+    try:
+        # spawn: never fork a process that already has SDL and the gesture/UDP threads running
+        pool = ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+        # Start the worker and compile the search kernel now, while the player makes the first move
+        pool.submit(warm_up_search)
+        return pool
+    except Exception as e:
+        print(f"AI worker process unavailable, searching on a thread instead: {e}")
+        return ThreadPoolExecutor(max_workers=1)
+
+
+# Finished AI search futures, put by the executor's callback thread and drained by the game loop
+AI_RESULT_QUEUE = queue.Queue()
+
+
+def submit_ai_move(ai_pool, ai_player, game):
+    """Queues the AI search for the current position and returns its Future"""
+    future = ai_pool.submit(search_best_move, ai_player.depth, game.snapshot())
+    future.add_done_callback(AI_RESULT_QUEUE.put)
+    return future
+
+
+def apply_ai_move(game, ai_move):
+    """Play the AI's (from_row, from_col, to_row, to_col) answer on the real game"""
+    if ai_move:
+        from_row, from_col, to_row, to_col = ai_move
+        game.apply_ai_move((from_row, from_col), (to_row, to_col))
 
 
 def main():
@@ -249,6 +352,13 @@ def main():
     pygame.init()
     pygame.mixer.init()
     
+    # Only queue the events the loops handle; hover effects read pygame.mouse.get_pos(), so mouse
+    # motion, focus and joystick floods never become Python Event objects. Expose/restore stay
+    # allowed so the redraw gate repaints an uncovered window (USEREVENT + 2 = gesture command)
+    pygame.event.set_blocked(None)
+    pygame.event.set_allowed([QUIT, KEYDOWN, MOUSEBUTTONDOWN, VIDEORESIZE, VIDEOEXPOSE,
+                              WINDOWEXPOSED, WINDOWRESTORED, pygame.USEREVENT + 2])
+    
     # Try to initialize gesture control (optional)
     gesture_controller = None
     try:
@@ -277,11 +387,18 @@ def main():
     # --- UDP listener for gesture commands ---
     GESTURE_UDP_PORT = 5006
     GESTURE_EVENT = pygame.USEREVENT + 2
+    CURSOR_PREFIX = b'cursor:'
 
     def udp_listener(stop_event):
         """Listen for UDP gesture commands and post pygame events."""
         sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        sock.setblocking(False)
+        try:
+            # Room for a burst of cursor updates from a fast gesture stream
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 1 << 16)
+        except OSError:
+            pass
+        # Block until a command arrives, waking twice a second to check stop_event
+        sock.settimeout(0.5)
         try:
             sock.bind(("127.0.0.1", GESTURE_UDP_PORT))
         except Exception as e:
@@ -289,21 +406,33 @@ def main():
             return
 
         while not stop_event.is_set():
-            # Use select to poll the socket without blocking
-            rlist, _, _ = select.select([sock], [], [], 0.05)
-            if sock in rlist:
+            try:
+                batch = [sock.recvfrom(1024)]
+            except Exception:
+                continue
+            # Drain whatever else is already queued without blocking
+            while select.select([sock], [], [], 0)[0]:
                 try:
-                    data, addr = sock.recvfrom(1024)
-                    cmd = data.decode('utf-8').strip()
-                    # Post a pygame event with the gesture command
-                    pygame.event.post(pygame.event.Event(GESTURE_EVENT, {"cmd": cmd}))
-                    # Send ACK back to the sender
+                    batch.append(sock.recvfrom(1024))
+                except Exception:
+                    break
+            for i, (data, addr) in enumerate(batch):
+                data = data.strip()
+                # A cursor position immediately followed by another one is already stale,
+                # so it is checked on the raw bytes and never decoded or posted
+                superseded = (data.startswith(CURSOR_PREFIX) and i + 1 < len(batch)
+                              and batch[i + 1][0].startswith(CURSOR_PREFIX))
+                if not superseded:
                     try:
-                        sock.sendto(f"ACK:{cmd}".encode('utf-8'), addr)
+                        # Post a pygame event with the gesture command
+                        pygame.event.post(pygame.event.Event(GESTURE_EVENT, cmd=data.decode('utf-8')))
                     except Exception:
-                        pass
+                        continue
+                # Send ACK back to the sender
+                try:
+                    sock.sendto(b"ACK:" + data, addr)
                 except Exception:
-                    continue
+                    pass
 
     udp_stop = threading.Event()
     udp_thread = threading.Thread(target=udp_listener, args=(udp_stop,), daemon=True)
@@ -329,20 +458,28 @@ def main():
     game_mode = None
     ai_player = None
     ai_depth = 3
-    font = pygame.font.SysFont("segoeui", 36, bold=True)
-    
-    # Custom event for AI move completion
-    AI_MOVE_COMPLETE = pygame.USEREVENT + 1 # Define this custom event ID
     
     # --- Game mode selection screen ---
     # Game mode selection
     selecting_mode = True
+    btn_classic = btn_ai = pygame.Rect(0, 0, 0, 0)
     while selecting_mode:
-        btn_classic, btn_ai = draw_mode_selection(window, font)
-        for event in pygame.event.get():
+        if pygame.display.get_active():
+            btn_classic, btn_ai = draw_mode_selection(window)
+            events = pygame.event.get()
+        else:
+            # Minimized or hidden: there is nothing visible to animate, so sleep until an event
+            # arrives, waking a few times a second to notice the window coming back
+            _mode_screen_state["key"] = None  # present the whole window again once it is shown
+            event = pygame.event.wait(250)
+            events = [event] if event.type != NOEVENT else []
+        for event in events:
             if event.type == QUIT or (event.type == KEYDOWN and event.key == K_ESCAPE):
                 pygame.quit()
                 sys.exit()
+            if event.type in (WINDOWEXPOSED, WINDOWRESTORED, VIDEOEXPOSE):
+                # Part of the window was uncovered: present all of it on the next frame
+                _mode_screen_state["key"] = None
             if event.type == MOUSEBUTTONDOWN:
                 if btn_classic.collidepoint(event.pos):
                     game_mode = "2V2"
@@ -353,40 +490,50 @@ def main():
                     ai_depth = 2  # Fixed AI depth for "AI Opponent"
                     ai_player = ChessAI(depth=ai_depth)
                     selecting_mode = False
-        clock.tick(60)
+        clock.tick(MENU_FPS)
     
     # Initialize game state with selected mode
     game = ChessGame(sounds, game_mode=game_mode)
+    ai_pool = create_ai_pool() if game_mode == "AI" else None
     
     # Main game loop
     running = True
     ai_thinking = False
-    ai_thread = None # Reference to the AI thread
+    ai_future = None # Pending AI search in the worker pool
     button_rects = {}  # Store button rectangles for click detection
     stats_return_button = None  # Store stats return button rectangle
+    needs_redraw = True  # Only repaint when something on screen can have changed
+    last_mouse_pos = None
+    thinking_frame = None  # Dot count of the "AI is thinking" label last drawn
     
     while running:
         # Get mouse position for hover effects
         mouse_pos = pygame.mouse.get_pos()
+        if mouse_pos != last_mouse_pos:
+            last_mouse_pos = mouse_pos
+            needs_redraw = True
         
         for event in pygame.event.get():
+            # Every handled event (clicks, keys, gestures, AI moves, resizes, window exposes/restores) may change the screen
+            needs_redraw = True
             if event.type == QUIT:
                 if game and hasattr(game, 'close_engine'):
                     game.close_engine()
                 running = False
             if event.type == VIDEORESIZE:
                 # Handle window resize
-                from constants import MIN_WINDOW_WIDTH, MIN_WINDOW_HEIGHT
                 new_width = max(event.w, MIN_WINDOW_WIDTH)
                 new_height = max(event.h, MIN_WINDOW_HEIGHT)
                 window = pygame.display.set_mode((new_width, new_height), pygame.RESIZABLE)
                 current_window_width = new_width
                 current_window_height = new_height
             if event.type == KEYDOWN:
+                # One key, one action; key events match none of the handlers below
                 if event.key == K_ESCAPE:
                     running = False
-                if event.key == K_s:
+                elif event.key == K_s:
                     show_score_screen = not show_score_screen
+                continue
 
             # Handle gesture UDP events
             if event.type == GESTURE_EVENT and not show_score_screen and not ai_thinking:
@@ -450,8 +597,7 @@ def main():
                             # If in AI mode and human moved, trigger AI
                             if game_mode == 'AI' and moved and not game.game_over and game.turn == 'b':
                                 ai_thinking = True
-                                ai_thread = threading.Thread(target=ai_move_thread, args=(ai_player, game.copy(), pygame.event))
-                                ai_thread.start()
+                                ai_future = submit_ai_move(ai_pool, ai_player, game)
                     elif cmd == 'confirm':
                         # Confirm (drop) - try to move to cursor
                         if game.selected_piece:
@@ -459,8 +605,7 @@ def main():
                             moved = game.move_piece(to_row, to_col)
                             if game_mode == 'AI' and moved and not game.game_over and game.turn == 'b':
                                 ai_thinking = True
-                                ai_thread = threading.Thread(target=ai_move_thread, args=(ai_player, game.copy(), pygame.event))
-                                ai_thread.start()
+                                ai_future = submit_ai_move(ai_pool, ai_player, game)
                     elif cmd == 'dwell':
                         # Dwell gesture acts as select-or-confirm
                         if game.selected_piece:
@@ -468,14 +613,12 @@ def main():
                             moved = game.move_piece(to_row, to_col)
                             if game_mode == 'AI' and moved and not game.game_over and game.turn == 'b':
                                 ai_thinking = True
-                                ai_thread = threading.Thread(target=ai_move_thread, args=(ai_player, game.copy(), pygame.event))
-                                ai_thread.start()
+                                ai_future = submit_ai_move(ai_pool, ai_player, game)
                         else:
                             moved = game.select_piece(row, col)
                             if game_mode == 'AI' and moved and not game.game_over and game.turn == 'b':
                                 ai_thinking = True
-                                ai_thread = threading.Thread(target=ai_move_thread, args=(ai_player, game.copy(), pygame.event))
-                                ai_thread.start()
+                                ai_future = submit_ai_move(ai_pool, ai_player, game)
                     elif cmd == 'cancel':
                         game.selected_piece = None
                         game.valid_moves = []
@@ -494,14 +637,16 @@ def main():
                             game.reset_game()
                             show_score_screen = False
                             ai_thinking = False
-                            if ai_thread and ai_thread.is_alive():
-                                ai_thread = None
+                            if ai_future:
+                                ai_future.cancel()
+                                ai_future = None
                             continue
                         elif button_rects.get('undo') and button_rects['undo'].collidepoint(x, y):
                             # Undo move
                             game.undo_move()
-                            if ai_thread and ai_thread.is_alive():
-                                ai_thread = None
+                            if ai_future:
+                                ai_future.cancel()
+                                ai_future = None
                             # If in AI mode and it's now human's turn, undo one more move
                             if game_mode == "AI" and game.turn == 'b': # 'b' for black (AI)
                                 game.undo_move()
@@ -515,19 +660,17 @@ def main():
                             running = False
                             continue
                     
-                    # Only process clicks on the board area (assuming 8x8 squares, 80 pixels each)
-                    if x < 8 * 80 and y < 8 * 80:  # Adjust based on your BOARD_WIDTH/HEIGHT and SQUARE_SIZE
-                        col = x // 80  
-                        row = y // 80  
+                    # Only process clicks on the board area
+                    if BOARD_RECT.collidepoint(x, y):
+                        col = (x - BOARD_RECT.x) // SQUARE_SIZE
+                        row = (y - BOARD_RECT.y) // SQUARE_SIZE
                         moved = game.select_piece(row, col) # This attempts to select a piece or make a move
                         
                         # If in AI mode and human just made a valid move, trigger AI's turn
                         if game_mode == "AI" and moved and not game.game_over and game.turn == 'b':
                             ai_thinking = True
-                            # Start AI calculation in a separate thread
-                            # Pass a deep copy of the game object to the AI thread
-                            ai_thread = threading.Thread(target=ai_move_thread, args=(ai_player, game.copy(), pygame.event))
-                            ai_thread.start()
+                            # Start AI calculation in the worker process on a snapshot of the position
+                            ai_future = submit_ai_move(ai_pool, ai_player, game)
             
             # Handle mouse clicks on stats page
             if event.type == MOUSEBUTTONDOWN and show_score_screen:
@@ -538,41 +681,60 @@ def main():
                         show_score_screen = False
                         continue
             
-            # NEW: Handle the custom event when AI move calculation is complete
-            if event.type == AI_MOVE_COMPLETE:
-                ai_move = event.ai_move # The calculated move from the AI thread
-                if ai_move:
-                    from_row, from_col, to_row, to_col = ai_move
-                    
-                    # Apply the AI's move to the actual game board (game object)
-                    # Your game.select_piece and game.move_piece should handle this.
-                    # This simulates the human clicking the AI's selected piece, then its destination.
-                    game.selected_piece = (from_row, from_col)
-                    game.valid_moves = game.get_valid_moves(from_row, from_col) # Recalculate valid moves for visual
-                    game.move_piece(to_row, to_col) # This actually executes the move on the main game board
-                
+        # Apply a finished AI search; searches cancelled by restart/undo are dropped
+        try:
+            finished = AI_RESULT_QUEUE.get_nowait()
+        except queue.Empty:
+            finished = None
+        if finished is not None and finished is ai_future:
+            ai_future = None
+            needs_redraw = True
+            try:
+                apply_ai_move(game, finished.result())
                 ai_thinking = False # AI is no longer thinking
-                ai_thread = None # Clear the thread reference
-                
-        # Clear screen
-        from constants import PANEL_BG # Assuming PANEL_BG is defined in constants
-        window.fill(PANEL_BG)
-        
-        # Draw the game components
-        draw_board(window, game, pieces)
-        if show_score_screen:
-            stats_return_button = draw_score_screen(window, game, pieces, mouse_pos=mouse_pos)
-        else:
-            button_rects = draw_sidebar(window, game, pieces, mouse_pos=mouse_pos)
-        
-        # Update display
-        pygame.display.update()
+            except BrokenProcessPool as e:
+                print(f"AI worker process died, searching on a thread instead: {e}")
+                ai_pool.shutdown(wait=False, cancel_futures=True)
+                ai_pool = ThreadPoolExecutor(max_workers=1)
+                ai_future = submit_ai_move(ai_pool, ai_player, game)
+            except Exception as e:
+                print(f"Error calculating AI move: {e}")
+                ai_thinking = False
+
+        # Step the thinking dots four times a second
+        frame = (pygame.time.get_ticks() // 250) % 4 if ai_thinking else None
+        if frame != thinking_frame:
+            thinking_frame = frame
+            needs_redraw = True
+
+        # The check glow and game-over banner pulse, and moving pieces and capture particles
+        # play out over several frames, so keep animating while any of them is shown
+        if (needs_redraw or game.game_over or game.check[game.turn]
+                or game.current_animation or game.particle_systems):
+            # Clear screen
+            window.fill(PANEL_BG)
+            
+            # Draw the game components
+            draw_board(window, game, pieces)
+            if show_score_screen:
+                stats_return_button = draw_score_screen(window, game, pieces, mouse_pos=mouse_pos)
+            else:
+                button_rects = draw_sidebar(window, game, pieces, mouse_pos=mouse_pos)
+                if thinking_frame is not None:
+                    _draw_thinking_indicator(window, thinking_frame)
+            
+            # Update display
+            pygame.display.update()
+            needs_redraw = False
         clock.tick(FPS)
 
     # Ensure engine (if any) is closed gracefully when exiting the application
     if game and hasattr(game, 'close_engine'):
         game.close_engine()
     
+    if ai_pool:
+        ai_pool.shutdown(wait=False, cancel_futures=True)
+
     # Clean up gesture control
     if gesture_controller:
         try:
@@ -585,4 +747,4 @@ def main():
     sys.exit()
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run_maybe_profiled(main)
\ No newline at end of file
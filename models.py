@@ -4,6 +4,192 @@ from animations import Animation, ParticleSystem, CheckmateAnimation
 import chess
 import chess.engine
 
+# Square codes used by ChessGame.snapshot(): each byte is an index into this tuple (0 = empty)
+SNAPSHOT_PIECES = ('', 'wp', 'wn', 'wb', 'wr', 'wq', 'wk', 'bp', 'bn', 'bb', 'br', 'bq', 'bk')
+_SNAPSHOT_CODES = {piece: code for code, piece in enumerate(SNAPSHOT_PIECES)}
+
+# Attack detection works on bitboards: bit (row * 8 + col) stands for board[row][col]
+_KNIGHT_OFFSETS = ((2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1))
+_KING_OFFSETS = ((0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, -1), (-1, 1))
+
+def _offset_masks(offsets):
+    """For every square, the bitboard of the on-board squares at the given (dr, dc) offsets"""
+    masks = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        mask = 0
+        for dr, dc in offsets:
+            if 0 <= row + dr < 8 and 0 <= col + dc < 8:
+                mask |= 1 << ((row + dr) * 8 + col + dc)
+        masks.append(mask)
+    return masks
+
+def _ray_masks(dr, dc):
+    """For every square, the bitboard of the squares strictly beyond it in direction (dr, dc)"""
+    masks = []
+    for sq in range(64):
+        row, col = divmod(sq, 8)
+        mask = 0
+        r, c = row + dr, col + dc
+        while 0 <= r < 8 and 0 <= c < 8:
+            mask |= 1 << (r * 8 + c)
+            r, c = r + dr, c + dc
+        masks.append(mask)
+    return masks
+
+# Pre-bounds-checked destination squares per (row, col), for the list-based move generators
+KNIGHT_TARGETS = [[tuple((row + dr, col + dc) for dr, dc in _KNIGHT_OFFSETS if 0 <= row + dr < 8 and 0 <= col + dc < 8)
+                   for col in range(8)] for row in range(8)]
+KING_TARGETS = [[tuple((row + dr, col + dc) for dr, dc in _KING_OFFSETS if 0 <= row + dr < 8 and 0 <= col + dc < 8)
+                 for col in range(8)] for row in range(8)]
+
+KNIGHT_ATTACKS = _offset_masks(_KNIGHT_OFFSETS)
+KING_ATTACKS = _offset_masks(_KING_OFFSETS)
+# Squares an enemy pawn must stand on to attack a square of the given side's piece
+PAWN_CHECKERS = {'w': _offset_masks(((-1, -1), (-1, 1))), 'b': _offset_masks(((1, -1), (1, 1)))}
+# Rays toward higher square numbers meet their nearest blocker at the lowest set bit,
+# rays toward lower square numbers at the highest one
+_DIAGONAL_RAYS_UP = (_ray_masks(1, 1), _ray_masks(1, -1))
+_DIAGONAL_RAYS_DOWN = (_ray_masks(-1, -1), _ray_masks(-1, 1))
+_STRAIGHT_RAYS_UP = (_ray_masks(0, 1), _ray_masks(1, 0))
+_STRAIGHT_RAYS_DOWN = (_ray_masks(0, -1), _ray_masks(-1, 0))
+
+def _ray_attacks(sq, occupied, rays_up, rays_down):
+    """Squares a slider on sq reaches along the given rays, stopping at (and including) blockers"""
+    attacks = 0
+    for rays in rays_up:
+        ray = rays[sq]
+        blockers = ray & occupied
+        if blockers:
+            ray ^= rays[(blockers & -blockers).bit_length() - 1]
+        attacks |= ray
+    for rays in rays_down:
+        ray = rays[sq]
+        blockers = ray & occupied
+        if blockers:
+            ray ^= rays[blockers.bit_length() - 1]
+        attacks |= ray
+    return attacks
+
+def _relevant_masks(rays_up, rays_down):
+    """Per square, the ray squares whose occupancy can change the attacks (each ray minus its edge square)"""
+    masks = []
+    for sq in range(64):
+        mask = 0
+        for rays in rays_up:
+            ray = rays[sq]
+            if ray:
+                mask |= ray ^ (1 << (ray.bit_length() - 1))  # farthest square is the highest bit
+        for rays in rays_down:
+            ray = rays[sq]
+            if ray:
+                mask |= ray ^ (ray & -ray)  # farthest square is the lowest bit
+        masks.append(mask)
+    return masks
+
+# Sliding attacks are looked up like magic bitboards: the relevant occupancy bits index a per-square
+# table (a dict does the hashing that the magic multiply and shift do in C engines). Each square's
+# table holds every occupancy subset and is built the first time that square is queried.
+ROOK_MASKS = _relevant_masks(_STRAIGHT_RAYS_UP, _STRAIGHT_RAYS_DOWN)
+BISHOP_MASKS = _relevant_masks(_DIAGONAL_RAYS_UP, _DIAGONAL_RAYS_DOWN)
+_ROOK_TABLES = [None] * 64
+_BISHOP_TABLES = [None] * 64
+
+def _build_slider_table(sq, mask, rays_up, rays_down):
+    """Attacks from sq for every subset of mask (enumerated with the carry-rippler trick)"""
+    table = {}
+    subset = 0
+    while True:
+        table[subset] = _ray_attacks(sq, subset, rays_up, rays_down)
+        subset = (subset - mask) & mask
+        if not subset:
+            return table
+
+def rook_attacks(sq, occupied):
+    """Bitboard of the squares a rook on sq attacks"""
+    table = _ROOK_TABLES[sq]
+    if table is None:
+        table = _ROOK_TABLES[sq] = _build_slider_table(sq, ROOK_MASKS[sq], _STRAIGHT_RAYS_UP, _STRAIGHT_RAYS_DOWN)
+    return table[occupied & ROOK_MASKS[sq]]
+
+def bishop_attacks(sq, occupied):
+    """Bitboard of the squares a bishop on sq attacks"""
+    table = _BISHOP_TABLES[sq]
+    if table is None:
+        table = _BISHOP_TABLES[sq] = _build_slider_table(sq, BISHOP_MASKS[sq], _DIAGONAL_RAYS_UP, _DIAGONAL_RAYS_DOWN)
+    return table[occupied & BISHOP_MASKS[sq]]
+
+def _squares(bitboard):
+    """(row, col) of every set bit, lowest square first"""
+    squares = []
+    while bitboard:
+        low = bitboard & -bitboard
+        squares.append(divmod(low.bit_length() - 1, 8))
+        bitboard ^= low
+    return squares
+
+def _attack_masks(board, color):
+    """
+    Bitboards for testing attacks on `color`: (occupied, own king square or -1, enemy pawns,
+    enemy knights, enemy bishops+queens, enemy rooks+queens, enemy king)
+    """
+    occupied = pawns = knights = diagonal = straight = king = 0
+    king_sq = -1
+    own_king = color + 'k'
+    bit = 1
+    sq = 0
+    for row in board:
+        for piece in row:
+            if piece:
+                occupied |= bit
+                if piece[0] != color:
+                    kind = piece[1]
+                    if kind == 'p':
+                        pawns |= bit
+                    elif kind == 'n':
+                        knights |= bit
+                    elif kind == 'b':
+                        diagonal |= bit
+                    elif kind == 'r':
+                        straight |= bit
+                    elif kind == 'q':
+                        diagonal |= bit
+                        straight |= bit
+                    else:
+                        king |= bit
+                elif piece == own_king:
+                    king_sq = sq
+            bit <<= 1
+            sq += 1
+    return occupied, king_sq, pawns, knights, diagonal, straight, king
+
+def _is_attacked(sq, color, occupied, pawns, knights, diagonal, straight, king):
+    """True if the enemy pieces in the masks attack square sq of the given side"""
+    if (PAWN_CHECKERS[color][sq] & pawns or KNIGHT_ATTACKS[sq] & knights
+            or KING_ATTACKS[sq] & king):
+        return True
+    return bool((diagonal and bishop_attacks(sq, occupied) & diagonal)
+                or (straight and rook_attacks(sq, occupied) & straight))
+
+def _own_pieces(masks):
+    """Bitboard of the side's own pieces from _attack_masks output"""
+    occupied, _, pawns, knights, diagonal, straight, king = masks
+    return occupied ^ (pawns | knights | diagonal | straight | king)
+
+def _move_leaves_king_attacked(masks, from_sq, to_sq, color):
+    """would_move_cause_check on precomputed _attack_masks: plain from -> to move, no side effects"""
+    occupied, king_sq, pawns, knights, diagonal, straight, king = masks
+    from_bit = 1 << from_sq
+    to_bit = 1 << to_sq
+    if from_sq == king_sq:
+        king_sq = to_sq
+    elif king_sq < 0:
+        return False  # No king found
+    # A piece on the destination is captured, so it stops attacking
+    keep = ~to_bit
+    return _is_attacked(king_sq, color, (occupied & ~from_bit) | to_bit, pawns & keep, knights & keep,
+                        diagonal & keep, straight & keep, king & keep)
+
 class ChessGame:
     def __init__(self, sounds, game_mode="2V2", stockfish_path="stockfish"):
         self.sounds = sounds
@@ -14,41 +200,46 @@ class ChessGame:
         # Only start Stockfish engine for legacy AI mode (if needed)
         # The new minimax AI doesn't need Stockfish
 
-    def copy(self):
+    def snapshot(self):
+        """
+        Returns the position as a small immutable tuple for the AI worker:
+        (board_bytes, turn, castling, en_passant_target, halfmove_clock, fullmove_number,
+        last_move, check, game_over, winner). board_bytes holds one SNAPSHOT_PIECES code per square.
+        """
+        board_bytes = bytes([_SNAPSHOT_CODES[piece] for row in self.board for piece in row])
+        rights = self.castling_rights
+        castling = (rights['w']['king_side'], rights['w']['queen_side'],
+                    rights['b']['king_side'], rights['b']['queen_side'])
+        return (board_bytes, self.turn, castling, self.en_passant_target, self.halfmove_clock,
+                self.fullmove_number, self.last_move, (self.check['w'], self.check['b']),
+                self.game_over, self.winner)
+
+    @classmethod
+    def from_snapshot(cls, snap, sounds=None, game_mode="AI"):
         """
-        Creates a deep copy of a ChessGame instance for AI to simulate moves without altering the main game.
+        Rebuilds a ChessGame from snapshot() output. Without sounds the game is silent,
+        which is what the AI worker process uses.
         """
-        new_game = ChessGame(self.sounds, self.game_mode, self.stockfish_path)
-
-        # Deep copy all mutable attributes
-        new_game.board = copy.deepcopy(self.board)
-        new_game.turn = self.turn
-        new_game.selected_piece = self.selected_piece  # Tuple, immutable
-        new_game.valid_moves = copy.deepcopy(self.valid_moves)  # List of tuples
-        new_game.game_over = self.game_over
-        new_game.winner = self.winner
-        new_game.captured_pieces = copy.deepcopy(self.captured_pieces)
-        new_game.scores = copy.deepcopy(self.scores)
-        new_game.move_history = copy.deepcopy(self.move_history)
-        new_game.check = copy.deepcopy(self.check)
-        new_game.castling_rights = copy.deepcopy(self.castling_rights)
-        new_game.en_passant_target = self.en_passant_target  # Tuple, immutable
-        new_game.halfmove_clock = self.halfmove_clock
-        new_game.fullmove_number = self.fullmove_number
-        new_game.last_move = self.last_move  # Tuple, immutable
-        new_game.stats = copy.deepcopy(self.stats)
-        new_game.current_animation = None  # Animations shouldn't persist in copies
-        new_game.animating_piece = None
-        new_game.particle_systems = []  # Particle systems are transient
-        new_game.checkmate_animation = None
-        new_game.showing_checkmate = self.showing_checkmate
-        new_game.player_names = copy.deepcopy(self.player_names)
-        new_game.game_states = copy.deepcopy(self.game_states)
-
-        # Engine is not copied; AI will use its own engine if needed
-        new_game.engine = None
-
-        return new_game
+        (board_bytes, turn, castling, en_passant_target, halfmove_clock, fullmove_number,
+         last_move, check, game_over, winner) = snap
+        game = cls(sounds if sounds is not None else {}, game_mode=game_mode)
+        # Fill the rows reset_game() already allocated
+        for r, row in enumerate(game.board):
+            row[:] = [SNAPSHOT_PIECES[code] for code in board_bytes[r * 8:r * 8 + 8]]
+        game.turn = turn
+        game.castling_rights = {
+            'w': {'king_side': castling[0], 'queen_side': castling[1]},
+            'b': {'king_side': castling[2], 'queen_side': castling[3]}
+        }
+        game.en_passant_target = en_passant_target
+        game.halfmove_clock = halfmove_clock
+        game.fullmove_number = fullmove_number
+        game.last_move = last_move
+        game.check = {'w': check[0], 'b': check[1]}
+        game.game_over = game_over
+        game.winner = winner
+        game._chess_board = None  # no move history to mirror; the AI worker searches with push()/pop()
+        return game
 
     def start_engine(self):
         try:
@@ -62,30 +253,6 @@ class ChessGame:
             self.engine.quit()
             self.engine = None
 
-    def get_chess_board(self):
-        # Convert your board to FEN (kept for legacy Stockfish support if needed)
-        rows = []
-        for row in self.board:
-            fen_row = ""
-            empty = 0
-            for cell in row:
-                if cell == "":
-                    empty += 1
-                else:
-                    if empty > 0:
-                        fen_row += str(empty)
-                        empty = 0
-                    piece = cell[1]
-                    color = cell[0]
-                    symbol = piece.upper() if color == "w" else piece.lower()
-                    fen_row += symbol
-            if empty > 0:
-                fen_row += str(empty)
-            rows.append(fen_row)
-        fen = "/".join(rows)
-        fen += " " + ("w" if self.turn == "w" else "b") + " - - 0 1"
-        return chess.Board(fen)
-
     def make_ai_move(self, time_limit=0.1):
         # Legacy Stockfish AI (kept for backward compatibility)
         if not self.engine:
@@ -95,15 +262,17 @@ class ChessGame:
                   "Please ensure the Stockfish binary is present, named 'stockfish', and executable in the project directory.\n"
                   "See the README or setup instructions for help.")
             return
-        board = self.get_chess_board()
+        if self._chess_board is None:
+            print("AI move unavailable: this position was rebuilt from a snapshot and has no chess.Board mirror.")
+            return
         try:
-            result = self.engine.play(board, chess.engine.Limit(time=time_limit))
+            result = self.engine.play(self._chess_board, chess.engine.Limit(time=time_limit))
             move = result.move
             # Convert move to your coordinates
-            start_col = ord(str(move)[0]) - ord('a')
-            start_row = 8 - int(str(move)[1])
-            end_col = ord(str(move)[2]) - ord('a')
-            end_row = 8 - int(str(move)[3])
+            start_col = chess.square_file(move.from_square)
+            start_row = 7 - chess.square_rank(move.from_square)
+            end_col = chess.square_file(move.to_square)
+            end_row = 7 - chess.square_rank(move.to_square)
             self.selected_piece = (start_row, start_col)
             self.move_piece(end_row, end_col)
         except Exception as e:
@@ -141,6 +310,8 @@ class ChessGame:
         self.halfmove_clock = 0  # For 50-move rule
         self.fullmove_number = 1
         self.last_move = None
+        self._push_stack = []  # undo records for push()/pop()
+        self._chess_board = chess.Board()  # python-chess mirror of the position, updated by move_piece
         
         # Stats tracking
         self.stats = {
@@ -194,7 +365,8 @@ class ChessGame:
     def undo_move(self):
         if len(self.game_states) > 1:  # Keep at least the initial state
             self.game_states.pop()  # Remove current state
-            prev_state = self.game_states[-1]
+            # Copy the saved state: it stays in game_states and must not be mutated by later moves
+            prev_state = copy.deepcopy(self.game_states[-1])
             
             # Restore previous state
             self.board = prev_state['board']
@@ -208,6 +380,8 @@ class ChessGame:
             self.halfmove_clock = prev_state['halfmove_clock']
             self.fullmove_number = prev_state['fullmove_number']
             self.stats = prev_state['stats']
+            if self._chess_board is not None and self._chess_board.move_stack:
+                self._chess_board.pop()
             
             # Clear selection and animations
             self.selected_piece = None
@@ -413,6 +587,7 @@ class ChessGame:
                     self.castling_rights[self.turn]['queen_side'] = False
                 elif start_col == 7:  # King-side rook
                     self.castling_rights[self.turn]['king_side'] = False
+            self._clear_captured_rook_rights(self.board[row][col], row, col)
             
             # Move the piece
             self.board[row][col] = piece
@@ -432,6 +607,11 @@ class ChessGame:
             self.move_history.append((start_row, start_col, row, col, piece, move_notation))
             self.last_move = (start_row, start_col, row, col)
             
+            # Keep the python-chess mirror in step (rows count down from rank 8)
+            if self._chess_board is not None:
+                self._chess_board.push(chess.Move(chess.square(start_col, 7 - start_row), chess.square(col, 7 - row),
+                                                  promotion=chess.QUEEN if promotion else None))
+            
             # Update half-move clock (for 50-move rule)
             if piece[1] == 'p' or capture:
                 self.halfmove_clock = 0
@@ -490,6 +670,88 @@ class ChessGame:
         
         return False
     
+    def apply_ai_move(self, from_rc, to_rc):
+        """
+        Plays a move chosen by the AI search. The search only returns legal moves, so the
+        destination is trusted instead of recomputing get_valid_moves for the piece.
+        """
+        self.selected_piece = from_rc
+        self.valid_moves = [to_rc]
+        return self.move_piece(*to_rc)
+
+    def push(self, from_rc, to_rc, promotion=None):
+        """
+        Plays a move on the board state only (no animation, sound, history, captures or stats),
+        so a search can explore it in place; pop() undoes it exactly. Board changes follow
+        move_piece: castling moves the rook, a diagonal pawn move to an empty square captures
+        en passant and a pawn on the last rank becomes `promotion` (queen by default).
+        """
+        start_row, start_col = from_rc
+        row, col = to_rc
+        board = self.board
+        piece = board[start_row][start_col]
+        rights = self.castling_rights
+        # Only the squares that change are recorded, with their previous contents
+        changed = [(start_row, start_col, piece), (row, col, board[row][col])]
+        self._push_stack.append((changed, self.turn, self.en_passant_target,
+                                 (rights['w']['king_side'], rights['w']['queen_side'],
+                                  rights['b']['king_side'], rights['b']['queen_side']),
+                                 self.halfmove_clock, self.fullmove_number, self.last_move,
+                                 self.game_over, self.winner))
+        capture = bool(board[row][col])
+
+        if piece[1] == 'k' and abs(start_col - col) > 1:
+            rook_from, rook_to = (7, col - 1) if col > start_col else (0, col + 1)
+            changed.append((row, rook_from, board[row][rook_from]))
+            changed.append((row, rook_to, board[row][rook_to]))
+            board[row][rook_to] = board[row][rook_from]
+            board[row][rook_from] = ''
+        elif piece[1] == 'p' and start_col != col and not capture:
+            changed.append((start_row, col, board[start_row][col]))
+            board[start_row][col] = ''
+            capture = True
+
+        self.en_passant_target = (row, col) if piece[1] == 'p' and abs(start_row - row) == 2 else None
+        if piece[1] == 'k':
+            rights[self.turn]['king_side'] = False
+            rights[self.turn]['queen_side'] = False
+        elif piece[1] == 'r':
+            if start_col == 0:
+                rights[self.turn]['queen_side'] = False
+            elif start_col == 7:
+                rights[self.turn]['king_side'] = False
+        self._clear_captured_rook_rights(board[row][col], row, col)
+
+        board[row][col] = piece
+        board[start_row][start_col] = ''
+        if piece[1] == 'p' and (row == 0 or row == 7):
+            board[row][col] = piece[0] + (promotion or 'q')
+
+        self.last_move = (start_row, start_col, row, col)
+        self.halfmove_clock = 0 if piece[1] == 'p' or capture else self.halfmove_clock + 1
+        if self.turn == 'b':
+            self.fullmove_number += 1
+        self.turn = 'b' if self.turn == 'w' else 'w'
+
+    def pop(self):
+        """Undoes the most recent push()"""
+        (changed, self.turn, self.en_passant_target, castling, self.halfmove_clock,
+         self.fullmove_number, self.last_move, self.game_over, self.winner) = self._push_stack.pop()
+        # Restore in reverse so a square recorded twice ends up with its oldest contents
+        for row, col, piece in reversed(changed):
+            self.board[row][col] = piece
+        rights = self.castling_rights
+        (rights['w']['king_side'], rights['w']['queen_side'],
+         rights['b']['king_side'], rights['b']['queen_side']) = castling
+
+    def _clear_captured_rook_rights(self, captured, row, col):
+        """A rook captured on its home square takes that side's castling right with it"""
+        if captured and captured[1] == 'r' and row == (7 if captured[0] == 'w' else 0):
+            if col == 0:
+                self.castling_rights[captured[0]]['queen_side'] = False
+            elif col == 7:
+                self.castling_rights[captured[0]]['king_side'] = False
+
     def get_move_notation(self, start_row, start_col, end_row, end_col, capture, castling, promotion, en_passant):
         if castling:
             return "O-O" if end_col > start_col else "O-O-O"
@@ -544,28 +806,28 @@ class ChessGame:
         piece_type = piece[1]
         color = piece[0]
         moves = []
+        # Occupancy and enemy attackers, shared by the sliding move lookups and the check filter
+        masks = _attack_masks(self.board, color)
         
         # Get all potential moves based on piece type
         if piece_type == 'p':  # Pawn
             moves = self.get_pawn_moves(row, col)
         elif piece_type == 'r':  # Rook
-            moves = self.get_rook_moves(row, col)
+            moves = self.get_rook_moves(row, col, masks)
         elif piece_type == 'n':  # Knight
             moves = self.get_knight_moves(row, col)
         elif piece_type == 'b':  # Bishop
-            moves = self.get_bishop_moves(row, col)
+            moves = self.get_bishop_moves(row, col, masks)
         elif piece_type == 'q':  # Queen
-            moves = self.get_queen_moves(row, col)
+            moves = self.get_queen_moves(row, col, masks)
         elif piece_type == 'k':  # King
             moves = self.get_king_moves(row, col)
         
         # Filter moves that would put or leave the king in check
         if check_check:
-            valid_moves = []
-            for move in moves:
-                if not self.would_move_cause_check(row, col, move[0], move[1], color):
-                    valid_moves.append(move)
-            return valid_moves
+            from_sq = row * 8 + col
+            return [move for move in moves
+                    if not _move_leaves_king_attacked(masks, from_sq, move[0] * 8 + move[1], color)]
         
         return moves
     
@@ -598,28 +860,13 @@ class ChessGame:
         
         return moves
     
-    def get_rook_moves(self, row, col):
-        moves = []
-        piece = self.board[row][col]
-        color = piece[0]
-        
-        # Rook can move horizontally and vertically
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                r, c = row + dr * i, col + dc * i
-                if not (0 <= r < 8 and 0 <= c < 8):
-                    break
-                
-                if not self.board[r][c]:  # Empty square
-                    moves.append((r, c))
-                else:  # Occupied square
-                    if self.board[r][c][0] != color:  # Opponent's piece
-                        moves.append((r, c))
-                    break  # Can't move further in this direction
-        
-        return moves
+    def get_rook_moves(self, row, col, masks=None):
+        # Rook can move horizontally and vertically, up to and including the first piece in each direction
+        color = self.board[row][col][0]
+        if masks is None:
+            masks = _attack_masks(self.board, color)
+        occupied = masks[0]
+        return _squares(rook_attacks(row * 8 + col, occupied) & ~_own_pieces(masks))
     
     def get_knight_moves(self, row, col):
         moves = []
@@ -627,45 +874,27 @@ class ChessGame:
         color = piece[0]
         
         # Knight moves in L-shape
-        knight_moves = [
-            (2, 1), (1, 2), (-1, 2), (-2, 1),
-            (-2, -1), (-1, -2), (1, -2), (2, -1)
-        ]
-        
-        for dr, dc in knight_moves:
-            r, c = row + dr, col + dc
-            if 0 <= r < 8 and 0 <= c < 8:
-                if not self.board[r][c] or self.board[r][c][0] != color:
-                    moves.append((r, c))
+        board = self.board
+        for r, c in KNIGHT_TARGETS[row][col]:
+            if not board[r][c] or board[r][c][0] != color:
+                moves.append((r, c))
         
         return moves
     
-    def get_bishop_moves(self, row, col):
-        moves = []
-        piece = self.board[row][col]
-        color = piece[0]
-        
-        # Bishop moves diagonally
-        directions = [(1, 1), (1, -1), (-1, -1), (-1, 1)]
-        
-        for dr, dc in directions:
-            for i in range(1, 8):
-                r, c = row + dr * i, col + dc * i
-                if not (0 <= r < 8 and 0 <= c < 8):
-                    break
-                
-                if not self.board[r][c]:  # Empty square
-                    moves.append((r, c))
-                else:  # Occupied square
-                    if self.board[r][c][0] != color:  # Opponent's piece
-                        moves.append((r, c))
-                    break  # Can't move further in this direction
-        
-        return moves
+    def get_bishop_moves(self, row, col, masks=None):
+        # Bishop moves diagonally, up to and including the first piece in each direction
+        color = self.board[row][col][0]
+        if masks is None:
+            masks = _attack_masks(self.board, color)
+        occupied = masks[0]
+        return _squares(bishop_attacks(row * 8 + col, occupied) & ~_own_pieces(masks))
     
-    def get_queen_moves(self, row, col):
+    def get_queen_moves(self, row, col, masks=None):
         # Queen combines rook and bishop movements
-        return self.get_rook_moves(row, col) + self.get_bishop_moves(row, col)
+        color = self.board[row][col][0]
+        if masks is None:
+            masks = _attack_masks(self.board, color)
+        return self.get_rook_moves(row, col, masks) + self.get_bishop_moves(row, col, masks)
     
     def get_king_moves(self, row, col):
         moves = []
@@ -673,16 +902,10 @@ class ChessGame:
         color = piece[0]
         
         # King moves one square in any direction
-        king_moves = [
-            (0, 1), (1, 0), (0, -1), (-1, 0),
-            (1, 1), (1, -1), (-1, -1), (-1, 1)
-        ]
-        
-        for dr, dc in king_moves:
-            r, c = row + dr, col + dc
-            if 0 <= r < 8 and 0 <= c < 8:
-                if not self.board[r][c] or self.board[r][c][0] != color:
-                    moves.append((r, c))
+        board = self.board
+        for r, c in KING_TARGETS[row][col]:
+            if not board[r][c] or board[r][c][0] != color:
+                moves.append((r, c))
         
         # Castling
         if not self.is_king_in_check(color):
@@ -702,142 +925,17 @@ class ChessGame:
     
     def would_square_be_in_check(self, row, col, color):
         """Check if a square would be under attack by opponent pieces"""
-        opponent = 'b' if color == 'w' else 'w'
-        
-        # Check for attacks by pawns
-        pawn_directions = [(-1, -1), (-1, 1)] if color == 'w' else [(1, -1), (1, 1)]
-        for dr, dc in pawn_directions:
-            r, c = row + dr, col + dc
-            if 0 <= r < 8 and 0 <= c < 8 and self.board[r][c] == opponent + 'p':
-                return True
-        
-        # Check for attacks by knights
-        knight_moves = [(2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1)]
-        for dr, dc in knight_moves:
-            r, c = row + dr, col + dc
-            if 0 <= r < 8 and 0 <= c < 8 and self.board[r][c] == opponent + 'n':
-                return True
-        
-        # Check for attacks by kings (for adjacent squares)
-        king_moves = [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, -1), (-1, 1)]
-        for dr, dc in king_moves:
-            r, c = row + dr, col + dc
-            if 0 <= r < 8 and 0 <= c < 8 and self.board[r][c] == opponent + 'k':
-                return True
-        
-        # Check for attacks by bishops, rooks, and queens along lines
-        # Diagonal directions (bishop, queen)
-        for dr, dc in [(1, 1), (1, -1), (-1, -1), (-1, 1)]:
-            for i in range(1, 8):
-                r, c = row + dr * i, col + dc * i
-                if not (0 <= r < 8 and 0 <= c < 8):
-                    break
-                
-                if self.board[r][c]:
-                    if self.board[r][c][0] == opponent and (self.board[r][c][1] == 'b' or self.board[r][c][1] == 'q'):
-                        return True
-                    break
-        
-        # Straight directions (rook, queen)
-        for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            for i in range(1, 8):
-                r, c = row + dr * i, col + dc * i
-                if not (0 <= r < 8 and 0 <= c < 8):
-                    break
-                
-                if self.board[r][c]:
-                    if self.board[r][c][0] == opponent and (self.board[r][c][1] == 'r' or self.board[r][c][1] == 'q'):
-                        return True
-                    break
-        
-        return False
+        occupied, _, pawns, knights, diagonal, straight, king = _attack_masks(self.board, color)
+        return _is_attacked(row * 8 + col, color, occupied, pawns, knights, diagonal, straight, king)
     
     def is_king_in_check(self, color):
         """Check if the king of the given color is in check"""
-        # Find the king
-        king_pos = None
-        for r in range(8):
-            for c in range(8):
-                if self.board[r][c] == color + 'k':
-                    king_pos = (r, c)
-                    break
-            if king_pos:
-                break
-        
-        if not king_pos:
+        occupied, king_sq, pawns, knights, diagonal, straight, king = _attack_masks(self.board, color)
+        if king_sq < 0:
             return False  # No king found (shouldn't happen in a real game)
-        
-        return self.would_square_be_in_check(king_pos[0], king_pos[1], color)
+        return _is_attacked(king_sq, color, occupied, pawns, knights, diagonal, straight, king)
     
     def would_move_cause_check(self, from_row, from_col, to_row, to_col, color):
         """Check if moving a piece would leave or put the king in check"""
-        # Make a temporary move
-        temp_board = [row[:] for row in self.board]
-        temp_piece = temp_board[from_row][from_col]
-        temp_board[to_row][to_col] = temp_piece
-        temp_board[from_row][from_col] = ''
-        
-        # Find the king
-        king_pos = None
-        for r in range(8):
-            for c in range(8):
-                if temp_board[r][c] == color + 'k':
-                    king_pos = (r, c)
-                    break
-            if king_pos:
-                break
-        
-        if not king_pos:
-            return False  # No king found
-        
-        # Check if king would be in check
-        opponent = 'b' if color == 'w' else 'w'
-        king_row, king_col = king_pos
-        
-        # Check for attacks by pawns
-        pawn_directions = [(-1, -1), (-1, 1)] if color == 'w' else [(1, -1), (1, 1)]
-        for dr, dc in pawn_directions:
-            r, c = king_row + dr, king_col + dc
-            if 0 <= r < 8 and 0 <= c < 8 and temp_board[r][c] == opponent + 'p':
-                return True
-        
-        # Check for attacks by knights
-        knight_moves = [(2, 1), (1, 2), (-1, 2), (-2, 1), (-2, -1), (-1, -2), (1, -2), (2, -1)]
-        for dr, dc in knight_moves:
-            r, c = king_row + dr, king_col + dc
-            if 0 <= r < 8 and 0 <= c < 8 and temp_board[r][c] == opponent + 'n':
-                return True
-        
-        # Check for attacks by kings
-        king_moves = [(0, 1), (1, 0), (0, -1), (-1, 0), (1, 1), (1, -1), (-1, -1), (-1, 1)]
-        for dr, dc in king_moves:
-            r, c = king_row + dr, king_col + dc
-            if 0 <= r < 8 and 0 <= c < 8 and temp_board[r][c] == opponent + 'k':
-                return True
-        
-        # Check for attacks by bishops, rooks, and queens
-        # Diagonal directions (bishop, queen)
-        for dr, dc in [(1, 1), (1, -1), (-1, -1), (-1, 1)]:
-            for i in range(1, 8):
-                r, c = king_row + dr * i, king_col + dc * i
-                if not (0 <= r < 8 and 0 <= c < 8):
-                    break
-                
-                if temp_board[r][c]:
-                    if temp_board[r][c][0] == opponent and (temp_board[r][c][1] == 'b' or temp_board[r][c][1] == 'q'):
-                        return True
-                    break
-        
-        # Straight directions (rook, queen)
-        for dr, dc in [(0, 1), (1, 0), (0, -1), (-1, 0)]:
-            for i in range(1, 8):
-                r, c = king_row + dr * i, king_col + dc * i
-                if not (0 <= r < 8 and 0 <= c < 8):
-                    break
-                
-                if temp_board[r][c]:
-                    if temp_board[r][c][0] == opponent and (temp_board[r][c][1] == 'r' or temp_board[r][c][1] == 'q'):
-                        return True
-                    break
-        
-        return False
\ No newline at end of file
+        return _move_leaves_king_attacked(_attack_masks(self.board, color), from_row * 8 + from_col,
+                                          to_row * 8 + to_col, color)
@@ -27,11 +27,16 @@ def main():
         pygame.init()
         pygame.mixer.init()
         
+        # Only queue the events the loops handle (USEREVENT + 1 = AI move complete); hover effects
+        # read pygame.mouse.get_pos(), so mouse motion and window/focus floods are never queued
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([QUIT, MOUSEBUTTONDOWN, pygame.USEREVENT + 1])
+        
         from utils import setup_window, create_piece_surfaces, initialize_sounds
         from models import ChessGame
         from ui import draw_board, draw_sidebar, draw_score_screen
         from ai import ChessAI
-        from constants import FPS
+        from constants import FPS, PANEL_BG
         import threading
         import math
         
@@ -55,7 +60,6 @@ def main():
         game_mode = None
         ai_player = None
         ai_depth = 3
-        font = pygame.font.SysFont("segoeui", 36, bold=True)
         
         # Custom event for AI move completion
         AI_MOVE_COMPLETE = pygame.USEREVENT + 1
@@ -70,7 +74,7 @@ def main():
         # Game mode selection
         selecting_mode = True
         while selecting_mode:
-            btn_classic, btn_ai = draw_mode_selection(window, font)
+            btn_classic, btn_ai = draw_mode_selection(window)
             for event in pygame.event.get():
                 if event.type == QUIT:
                     pygame.quit()
@@ -110,7 +114,6 @@ def main():
                 # Add other event handling here...
             
             # Clear screen
-            from constants import PANEL_BG
             window.fill(PANEL_BG)
             
             # Draw the game components
@@ -145,4 +148,5 @@ def main():
     return 0
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    from utils import run_maybe_profiled
+    sys.exit(run_maybe_profiled(main))
\ No newline at end of file
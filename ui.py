@@ -5,7 +5,7 @@ from constants import (
     LIGHT_SQUARE, DARK_SQUARE, HIGHLIGHT, LIGHT_HIGHLIGHT, MOVE_INDICATOR,
     RED_ACCENT, BLUE_ACCENT, WHITE, BLACK, DARK_OVERLAY, SCORE_BG, PANEL_BG
 )
-from utils import get_font
+from utils import get_font, get_sys_font, get_gradient_surface, get_scaled_piece, blit_batch
 
 def draw_professional_button(window, rect, text, is_hovered=False, button_type="primary"):
     """Draw a professional-looking button with gradient and hover effects"""
@@ -56,49 +56,63 @@ def draw_professional_button(window, rect, text, is_hovered=False, button_type="
         window.blit(highlight_surface, (inner_rect.x, inner_rect.y))
     
     # Draw button text
-    font = pygame.font.SysFont("segoeui", 16, bold=True)
+    font = get_sys_font("segoeui", 16, True)
     text_surface = font.render(text, True, scheme["text"])
     text_rect = text_surface.get_rect(center=rect.center)
     window.blit(text_surface, text_rect)
     
     return rect  # Return rect for click detection
 
-def draw_board(window, game, pieces):
-    # Draw chess board with 3D effect
-    board_surface = pygame.Surface((WIDTH, HEIGHT))
+# Squares and coordinate labels never change, so they are rendered once; the composed board
+# (highlights and pieces on top) is reused while the position and selection are unchanged
+_board_background = {"surface": None}
+_board_cache = {"key": None, "surface": None}
+
+def _get_board_background():
+    """Return the squares (with their 3D gradient rings) and coordinate labels"""
+    background = _board_background["surface"]
+    if background is None:
+        background = pygame.Surface((WIDTH, HEIGHT))
+        font = get_sys_font('Arial', 12)
+        for row in range(BOARD_SIZE):
+            for col in range(BOARD_SIZE):
+                # Create 3D effect with slightly different shades
+                if (row + col) % 2 == 0:  # Light square
+                    pygame.draw.rect(background, LIGHT_SQUARE, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+                    # Add subtle gradient
+                    for i in range(5):
+                        shade = (240 - i*5, 217 - i*3, 181 - i*3)
+                        pygame.draw.rect(background, shade, 
+                                         (col * SQUARE_SIZE + i, row * SQUARE_SIZE + i, 
+                                          SQUARE_SIZE - i*2, SQUARE_SIZE - i*2), 1)
+                else:  # Dark square
+                    pygame.draw.rect(background, DARK_SQUARE, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
+                    # Add subtle gradient
+                    for i in range(5):
+                        shade = (181 - i*5, 136 - i*3, 99 - i*3)
+                        pygame.draw.rect(background, shade, 
+                                         (col * SQUARE_SIZE + i, row * SQUARE_SIZE + i, 
+                                          SQUARE_SIZE - i*2, SQUARE_SIZE - i*2), 1)
+                
+                # Draw coordinates in small corner of squares
+                if row == 7:  # Bottom row - show file (column) labels
+                    label = font.render(chr(97 + col), True, (0, 0, 0) if (row + col) % 2 == 0 else (255, 255, 255))
+                    background.blit(label, (col * SQUARE_SIZE + SQUARE_SIZE - 12, row * SQUARE_SIZE + SQUARE_SIZE - 12))
+                
+                if col == 0:  # Leftmost column - show rank (row) labels
+                    label = font.render(str(8 - row), True, (0, 0, 0) if (row + col) % 2 == 0 else (255, 255, 255))
+                    background.blit(label, (col * SQUARE_SIZE + 3, row * SQUARE_SIZE + 3))
+        if pygame.display.get_surface() is not None:
+            background = background.convert()
+        _board_background["surface"] = background
+    return background
+
+def _compose_board(game, pieces):
+    """Draw the squares, highlights, border and resting pieces onto a new board Surface"""
+    board_surface = _get_board_background().copy()
     
-    # Draw board background
     for row in range(BOARD_SIZE):
         for col in range(BOARD_SIZE):
-            # Create 3D effect with slightly different shades
-            if (row + col) % 2 == 0:  # Light square
-                pygame.draw.rect(board_surface, LIGHT_SQUARE, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
-                # Add subtle gradient
-                for i in range(5):
-                    shade = (240 - i*5, 217 - i*3, 181 - i*3)
-                    pygame.draw.rect(board_surface, shade, 
-                                     (col * SQUARE_SIZE + i, row * SQUARE_SIZE + i, 
-                                      SQUARE_SIZE - i*2, SQUARE_SIZE - i*2), 1)
-            else:  # Dark square
-                pygame.draw.rect(board_surface, DARK_SQUARE, (col * SQUARE_SIZE, row * SQUARE_SIZE, SQUARE_SIZE, SQUARE_SIZE))
-                # Add subtle gradient
-                for i in range(5):
-                    shade = (181 - i*5, 136 - i*3, 99 - i*3)
-                    pygame.draw.rect(board_surface, shade, 
-                                     (col * SQUARE_SIZE + i, row * SQUARE_SIZE + i, 
-                                      SQUARE_SIZE - i*2, SQUARE_SIZE - i*2), 1)
-            
-            # Draw coordinates in small corner of squares
-            if row == 7:  # Bottom row - show file (column) labels
-                font = pygame.font.SysFont('Arial', 12)
-                label = font.render(chr(97 + col), True, (0, 0, 0) if (row + col) % 2 == 0 else (255, 255, 255))
-                board_surface.blit(label, (col * SQUARE_SIZE + SQUARE_SIZE - 12, row * SQUARE_SIZE + SQUARE_SIZE - 12))
-            
-            if col == 0:  # Leftmost column - show rank (row) labels
-                font = pygame.font.SysFont('Arial', 12)
-                label = font.render(str(8 - row), True, (0, 0, 0) if (row + col) % 2 == 0 else (255, 255, 255))
-                board_surface.blit(label, (col * SQUARE_SIZE + 3, row * SQUARE_SIZE + 3))
-            
             # Highlight last move
             if game.last_move:
                 from_row, from_col, to_row, to_col = game.last_move
@@ -140,7 +154,8 @@ def draw_board(window, game, pieces):
     # Add border around the board
     pygame.draw.rect(board_surface, (30, 30, 30), (0, 0, WIDTH, HEIGHT), 2)
     
-    # Draw pieces on the board
+    # Draw pieces on the board (collected and blitted in one batch)
+    piece_blits = []
     for row in range(BOARD_SIZE):
         for col in range(BOARD_SIZE):
             piece = game.board[row][col]
@@ -149,8 +164,18 @@ def draw_board(window, game, pieces):
                 if game.current_animation and game.selected_piece == (row, col):
                     continue
                 
-                # Draw the piece
-                board_surface.blit(pieces[piece], (col * SQUARE_SIZE, row * SQUARE_SIZE))
+                piece_blits.append((pieces[piece], (col * SQUARE_SIZE, row * SQUARE_SIZE)))
+    blit_batch(board_surface, piece_blits)
+    return board_surface
+
+def draw_board(window, game, pieces):
+    # Draw chess board with 3D effect; recompose only when something drawn on it changed
+    key = (tuple(map(tuple, game.board)), game.last_move, game.selected_piece, tuple(game.valid_moves),
+           game.check['w'], game.check['b'], game.current_animation is not None, id(pieces))
+    if key != _board_cache["key"]:
+        _board_cache["key"] = key
+        _board_cache["surface"] = _compose_board(game, pieces)
+    board_surface = _board_cache["surface"]
 
     # Draw gesture cursor if present
     if hasattr(game, 'gesture_cursor') and game.gesture_cursor:
@@ -168,6 +193,10 @@ def draw_board(window, game, pieces):
                 center = (gc_col * SQUARE_SIZE + SQUARE_SIZE // 2, gc_row * SQUARE_SIZE + SQUARE_SIZE // 2)
                 pygame.draw.circle(window, (255, 220, 80), center, dot_radius)
     
+    # Moving pieces and particles are drawn on a copy so the cached board stays clean
+    if game.current_animation or game.particle_systems:
+        board_surface = board_surface.copy()
+    
     # Draw animation if active
     if game.current_animation:
         pos = game.current_animation.update()
@@ -188,14 +217,16 @@ def draw_board(window, game, pieces):
     
     # Add drop shadow effect to the board
     shadow_offset = 5
-    shadow = pygame.Surface((WIDTH, HEIGHT))
-    shadow.fill((0, 0, 0))
-    window.blit(shadow, (shadow_offset, shadow_offset))
+    pygame.draw.rect(window, (0, 0, 0), (shadow_offset, shadow_offset, WIDTH, HEIGHT))
     
     # Blit the board to the window
     window.blit(board_surface, (0, 0))
 
-def draw_sidebar(window, game, pieces, sidebar_scroll=0, mouse_pos=None):
+# Sidebar panel (everything except the hover buttons) rendered while the position is unchanged
+_sidebar_cache = {"key": None, "surface": None}
+
+def _draw_sidebar_panel(window, game, pieces):
+    """Draw the sidebar title, turn, score, captures, history and game-over status onto window"""
     # Get current window dimensions
     window_width = window.get_width()
     window_height = window.get_height()
@@ -290,8 +321,7 @@ def draw_sidebar(window, game, pieces, sidebar_scroll=0, mouse_pos=None):
     
     # Display black pieces captured by white
     for i, piece in enumerate(game.captured_pieces['w']):
-        piece_symbol = pieces[piece]
-        small_piece = pygame.transform.scale(piece_symbol, (30, 30))
+        small_piece = get_scaled_piece(pieces, piece, 30)
         window.blit(small_piece, (white_captures_rect.x + 10 + i * 35, white_captures_rect.y + 20))
     
     # Black captures
@@ -303,8 +333,7 @@ def draw_sidebar(window, game, pieces, sidebar_scroll=0, mouse_pos=None):
     
     # Display white pieces captured by black
     for i, piece in enumerate(game.captured_pieces['b']):
-        piece_symbol = pieces[piece]
-        small_piece = pygame.transform.scale(piece_symbol, (30, 30))
+        small_piece = get_scaled_piece(pieces, piece, 30)
         window.blit(small_piece, (black_captures_rect.x + 10 + i * 35, black_captures_rect.y + 20))
     
     # Move history
@@ -359,8 +388,33 @@ def draw_sidebar(window, game, pieces, sidebar_scroll=0, mouse_pos=None):
         winner_text = font.render(status_text, True, WHITE)
         window.blit(winner_text, (status_rect.centerx - winner_text.get_width() // 2, 
                                status_rect.y + 25))
+
+def draw_sidebar(window, game, pieces, sidebar_scroll=0, mouse_pos=None):
+    # Get current window dimensions
+    window_width = window.get_width()
+    window_height = window.get_height()
+    sidebar_width = window_width - WIDTH
+    
+    # The check glow and game-over banner pulse every frame, so those states are drawn directly;
+    # otherwise the panel only changes with the position and is re-rendered when its inputs change
+    if game.game_over or game.check[game.turn]:
+        _draw_sidebar_panel(window, game, pieces)
+    else:
+        key = (window.get_size(), game.turn, game.check['w'], game.check['b'],
+               game.scores['w'], game.scores['b'],
+               tuple(game.captured_pieces['w']), tuple(game.captured_pieces['b']),
+               len(game.move_history), tuple(move[5] for move in game.move_history[-5:]))
+        panel = _sidebar_cache["surface"]
+        if key != _sidebar_cache["key"] or panel is None:
+            if panel is None or panel.get_size() != window.get_size():
+                panel = _sidebar_cache["surface"] = pygame.Surface(window.get_size()).convert()
+            _draw_sidebar_panel(panel, game, pieces)
+            _sidebar_cache["key"] = key
+        sidebar_rect = pygame.Rect(WIDTH, 0, sidebar_width, window_height)
+        window.blit(panel, sidebar_rect, sidebar_rect)
     
     # Controls Section with Buttons
+    status_y = min(630, window_height - 150)  # Same layout as the status banner in the panel
     controls_y = min(window_height - 120, status_y + 70)  # Position controls at bottom or after status
     
     # Action Buttons
@@ -420,15 +474,9 @@ def draw_score_screen(window, game, pieces, mouse_pos=None):
     pygame.draw.rect(shadow_surf, (0, 0, 0, 100), shadow_surf.get_rect(), border_radius=20)
     window.blit(shadow_surf, shadow_rect)
     
-    # Main panel background with gradient
-    for i in range(panel_height):
-        alpha = i / panel_height
-        color = (
-            int(SCORE_BG[0] + (SCORE_BG[0] * 0.3) * alpha),
-            int(SCORE_BG[1] + (SCORE_BG[1] * 0.3) * alpha),
-            int(SCORE_BG[2] + (SCORE_BG[2] * 0.3) * alpha)
-        )
-        pygame.draw.line(window, color, (panel_x, panel_y + i), (panel_x + panel_width, panel_y + i))
+    # Main panel background with gradient (SCORE_BG brightening by 30% towards the bottom)
+    window.blit(get_gradient_surface(panel_width, panel_height, SCORE_BG,
+                                     tuple(c * 1.3 for c in SCORE_BG)), (panel_x, panel_y))
     
     # Panel border
     pygame.draw.rect(window, (70, 80, 90), (panel_x, panel_y, panel_width, panel_height), 3, border_radius=20)
@@ -449,14 +497,7 @@ def draw_score_screen(window, game, pieces, mouse_pos=None):
     # Title bar with gradient
     title_height = 60
     title_rect = pygame.Rect(panel_x, panel_y, panel_width, title_height)
-    for i in range(title_height):
-        alpha = i / title_height
-        color = (
-            int(15 + (25 - 15) * alpha),
-            int(25 + (35 - 25) * alpha),
-            int(40 + (50 - 40) * alpha)
-        )
-        pygame.draw.line(window, color, (panel_x, panel_y + i), (panel_x + panel_width, panel_y + i))
+    window.blit(get_gradient_surface(panel_width, title_height, (15, 25, 40), (25, 35, 50)), (panel_x, panel_y))
     
     pygame.draw.rect(window, (70, 80, 90), title_rect, 2, border_top_left_radius=20, border_top_right_radius=20)
     
@@ -516,15 +557,10 @@ def draw_score_screen(window, game, pieces, mouse_pos=None):
     black_box = pygame.Rect(panel_x + 40 + box_width, comparison_y, box_width, comparison_height)
     
     for box, color, label, theme_color in [(white_box, 'w', "⚪ WHITE PLAYER", (50, 120, 200)), (black_box, 'b', "⚫ BLACK PLAYER", (60, 60, 60))]:
-        # Box background with improved gradient
-        for i in range(comparison_height):
-            alpha = i / comparison_height
-            bg_color = (
-                int(theme_color[0] * (0.2 + 0.3 * alpha)),
-                int(theme_color[1] * (0.2 + 0.3 * alpha)),
-                int(theme_color[2] * (0.2 + 0.3 * alpha))
-            )
-            pygame.draw.line(window, bg_color, (box.x, box.y + i), (box.right, box.y + i))
+        # Box background with improved gradient (20% -> 50% of the theme color)
+        window.blit(get_gradient_surface(box.width, comparison_height,
+                                         tuple(c * 0.2 for c in theme_color),
+                                         tuple(c * 0.5 for c in theme_color)), box.topleft)
         
         # Enhanced box border with subtle glow effect
         pygame.draw.rect(window, theme_color, box, 3, border_radius=12)
@@ -584,14 +620,8 @@ def draw_score_screen(window, game, pieces, mouse_pos=None):
         history_rect = pygame.Rect(panel_x + 20, history_y, panel_width - 40, history_height)
         
         # History background with subtle gradient
-        for i in range(history_height):
-            alpha = i / history_height
-            bg_color = (
-                int(25 + (35 - 25) * alpha),
-                int(35 + (45 - 35) * alpha),
-                int(45 + (55 - 45) * alpha)
-            )
-            pygame.draw.line(window, bg_color, (history_rect.x, history_rect.y + i), (history_rect.right, history_rect.y + i))
+        window.blit(get_gradient_surface(history_rect.width, history_height, (25, 35, 45), (35, 45, 55)),
+                    history_rect.topleft)
         
         pygame.draw.rect(window, (70, 80, 90), history_rect, 2, border_radius=12)
         
@@ -1,9 +1,13 @@
 import pygame
 import os
+import sys
+import functools
 import time
+import numpy as np
 from constants import SQUARE_SIZE, WHITE, BLACK
 
-# Font setup with fallbacks
+# Font setup with fallbacks; Font objects are cached so each file/system lookup happens once
+@functools.lru_cache(maxsize=64)
 def get_font(size, bold=False):
     try:
         # Try to use a modern, digital-looking font
@@ -16,6 +20,11 @@ def get_font(size, bold=False):
             # Last resort
             return pygame.font.Font(None, size)
 
+@functools.lru_cache(maxsize=64)
+def get_sys_font(name, size, bold=False):
+    """Shared pygame.font.SysFont registry: the system font lookup runs once per (name, size, bold)"""
+    return pygame.font.SysFont(name, size, bold=bold)
+
 # Initialize sound system
 def initialize_sounds():
     from constants import SOUNDS
@@ -33,9 +42,15 @@ def initialize_sounds():
     
     return SOUNDS
 
+# Piece images are loaded, converted and scaled once per run and shared by every caller
+_piece_surfaces = {}  # piece code -> Surface (SQUARE_SIZE x SQUARE_SIZE, display format)
+_scaled_piece_cache = {}  # (piece code, size) -> (source Surface, scaled Surface)
+
 # Create piece images, loading both black and white pieces from image files
 def create_piece_surfaces():
-    pieces = {}
+    if _piece_surfaces:
+        return _piece_surfaces
+    pieces = _piece_surfaces
     
     # Define piece mappings
     piece_types = {'p': 'pawn', 'r': 'rook', 'n': 'knight', 'b': 'bishop', 'q': 'queen', 'k': 'king'}
@@ -169,7 +184,7 @@ def create_fallback_piece(color, piece_type):
     # Add symbol with shadow effect
     font_size = int(SQUARE_SIZE * 0.6)
     try:
-        font = pygame.font.SysFont('Arial', font_size, bold=True)
+        font = get_sys_font('Arial', font_size, True)
     except:
         font = pygame.font.Font(None, font_size)
     
@@ -183,8 +198,25 @@ def create_fallback_piece(color, piece_type):
     text_rect = text.get_rect(center=center)
     surface.blit(text, text_rect)
     
+    if pygame.display.get_surface() is not None:
+        surface = surface.convert_alpha()
     return surface
 
+def get_scaled_piece(pieces, piece, size):
+    """Return pieces[piece] scaled to size x size, scaling each piece image only once"""
+    source = pieces[piece]
+    cached = _scaled_piece_cache.get((piece, size))
+    if cached is None or cached[0] is not source:
+        cached = _scaled_piece_cache[(piece, size)] = (source, pygame.transform.scale(source, (size, size)))
+    return cached[1]
+
+def blit_batch(surface, blit_sequence):
+    """Blit (source, dest) pairs in one call: fblits on pygame-ce, blits on stock pygame"""
+    if hasattr(surface, 'fblits'):
+        surface.fblits(blit_sequence)
+    else:
+        surface.blits(blit_sequence, doreturn=False)
+
 def setup_window():
     """Initialize the game window with icon"""
     from constants import WINDOW_WIDTH, WINDOW_HEIGHT, DARK_SQUARE, LIGHT_SQUARE, BLACK
@@ -252,23 +284,35 @@ def create_gradient_surface(width, height, color1, color2, vertical=True):
     """Create a gradient surface between two colors"""
     surface = pygame.Surface((width, height))
     
+    # One color per row (or column), built with NumPy and stretched across the surface
+    length = height if vertical else width
+    ratio = np.arange(length)[:, None] / length
+    ramp = (np.array(color1[:3]) * (1 - ratio) + np.array(color2[:3]) * ratio).astype(np.uint8)
+    # surfarray is indexed [x, y]
     if vertical:
-        for y in range(height):
-            ratio = y / height
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            pygame.draw.line(surface, (r, g, b), (0, y), (width, y))
+        pixels = np.broadcast_to(ramp[None, :, :], (width, height, 3))
     else:
-        for x in range(width):
-            ratio = x / width
-            r = int(color1[0] * (1 - ratio) + color2[0] * ratio)
-            g = int(color1[1] * (1 - ratio) + color2[1] * ratio)
-            b = int(color1[2] * (1 - ratio) + color2[2] * ratio)
-            pygame.draw.line(surface, (r, g, b), (x, 0), (x, height))
+        pixels = np.broadcast_to(ramp[:, None, :], (width, height, 3))
+    pygame.surfarray.blit_array(surface, pixels)
     
     return surface
 
+# Gradients that are redrawn every frame (score screen panels) are built once per size/colors
+_gradient_cache = {}
+
+def get_gradient_surface(width, height, color1, color2, vertical=True):
+    """Cached create_gradient_surface, converted to the display format for fast blits"""
+    key = (width, height, tuple(color1), tuple(color2), vertical)
+    surface = _gradient_cache.get(key)
+    if surface is None:
+        if len(_gradient_cache) > 64:  # window resizes create new sizes; keep the cache bounded
+            _gradient_cache.clear()
+        surface = create_gradient_surface(width, height, color1, color2, vertical)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert()
+        _gradient_cache[key] = surface
+    return surface
+
 def draw_thinking_animation(surface, rect, progress):
     """Draw an animated thinking indicator for AI"""
     from constants import WHITE, BLACK
@@ -420,4 +464,22 @@ def create_status_text(text, font, color=None):
     # Blit main text
     surface.blit(main_text, (0, 0))
     
-    return surface
\ No newline at end of file
+    return surface
+
+
+# Profiling support for the game entry points
+def run_maybe_profiled(main_func, profile_path="chess_profile.pstats"):
+    """
+    Runs main_func(); with --profile on the command line it runs under cProfile and the
+    stats are written to profile_path (view with e.g. `snakeviz chess_profile.pstats`).
+    """
+    if "--profile" not in sys.argv:
+        return main_func()
+    import cProfile
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(main_func)
+    finally:
+        # main() leaves through sys.exit(), so write the stats on the way out
+        profiler.dump_stats(profile_path)
+        print(f"Profile written to {profile_path}")